@@ -0,0 +1,76 @@
+"""
+Compares the OCR backends on the same rendered pages.
+
+    python -m benchmarks.ocr_backends <folder-or-pdf> [--pages 50] [--dpi 200] [--config "--psm 6"]
+
+Pages are rendered once up front so only OCR time is measured. Each backend
+gets one warm-up call (tesserocr loads its traineddata there) before timing.
+"""
+import os
+import sys
+import time
+import argparse
+import difflib
+
+from config.constants import DEFAULT_DPI
+from core.ocr_backends import PytesseractBackend, TesserocrBackend, tesserocr_available
+from core.rasterize import render_page
+
+
+def collect_pages(target, limit, dpi):
+    if os.path.isdir(target):
+        pdfs = sorted(os.path.join(target, f) for f in os.listdir(target) if f.lower().endswith(".pdf"))
+    else:
+        pdfs = [target]
+
+    pages = []
+    for path in pdfs[:limit]:
+        pages.append(render_page(path, 1, dpi))
+    return pages
+
+
+def time_backend(backend, pages, config):
+    backend.image_to_string(pages[0], config=config)
+    texts = []
+    start = time.perf_counter()
+    for image in pages:
+        texts.append(backend.image_to_string(image, config=config))
+    return time.perf_counter() - start, texts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark OCR backends on the same pages.")
+    parser.add_argument("target", help="PDF file or folder of PDFs (first page of each is used)")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI)
+    parser.add_argument("--config", default="--psm 6")
+    args = parser.parse_args(argv)
+
+    pages = collect_pages(args.target, args.pages, args.dpi)
+    if not pages:
+        print("No PDF pages found.")
+        return 1
+
+    backends = [PytesseractBackend()]
+    if tesserocr_available():
+        backends.append(TesserocrBackend(pool_size=1))
+    else:
+        print("tesserocr is not installed; only the pytesseract backend will be timed.")
+
+    results = {}
+    for backend in backends:
+        elapsed, texts = time_backend(backend, pages, args.config)
+        results[backend.name] = texts
+        print(f"{backend.name:12s} {len(pages)} pages in {elapsed:7.2f}s  "
+              f"({elapsed / len(pages) * 1000:7.1f} ms/page, {len(pages) / elapsed:5.2f} pages/s)")
+        backend.close()
+
+    if len(results) == 2:
+        a, b = results["pytesseract"], results["tesserocr"]
+        ratio = sum(difflib.SequenceMatcher(None, x, y).ratio() for x, y in zip(a, b)) / len(a)
+        print(f"text similarity between backends: {ratio:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Headless batch mode: OBR extraction, renames, split and merge without Qt.
+
+    python cli.py extract FOLDER -o obr.xlsx
+    python cli.py --workers 4 rename nca FOLDER
+    python cli.py split INPUT.pdf OUTPUT_FOLDER --ranges 1-3,5,8-
+    python cli.py split INPUT_FOLDER OUTPUT_FOLDER --chunk 10
+    python cli.py merge OUTPUT.pdf FIRST.pdf SECOND.pdf ...
+
+Global options such as --workers go before the subcommand.
+Progress is written to stdout as one JSON object per line ("--progress text"
+for humans, "none" to silence it). The exit status is non-zero if any file failed.
+"""
+import os
+import sys
+import json
+import argparse
+import multiprocessing
+
+from config.constants import OCR_WORKERS, OCR_CACHE_FILE
+from core.ocr_cache import configure_cache, get_cache
+from core.dpi_stats import DpiStats
+from core.manifest import FolderManifest
+from core.pipeline import ExtractPipeline, EXTRACT_JOB
+from core.obr_table import OBRTable
+from core.table_export import export_table, EXPORT_FORMATS
+from core.rename_engine import RenameCandidate, iter_analyze, auto_rename, already_named, rename_job
+from core.pdf_ops import merge_pdfs
+from core.split_engine import iter_split
+
+
+class Progress:
+    def __init__(self, style="json", stream=sys.stdout):
+        self.style = style
+        self.stream = stream
+        self.failures = 0
+
+    def emit(self, event, **fields):
+        if event == "error":
+            self.failures += 1
+        if self.style == "json":
+            self.stream.write(json.dumps(dict(event=event, **fields), ensure_ascii=False) + "\n")
+        elif self.style == "text":
+            details = " ".join(f"{k}={v}" for k, v in fields.items())
+            self.stream.write(f"{event}: {details}\n")
+        else:
+            return
+        self.stream.flush()
+
+
+def list_pdfs(folder):
+    return [f for f in os.listdir(folder) if f.lower().endswith(".pdf")]
+
+
+def run_extract(args, progress):
+    files = list_pdfs(args.folder)
+    manifest = FolderManifest(args.folder)
+    known = {}
+    if args.incremental:
+        files, known = manifest.partition(EXTRACT_JOB, files)
+
+    rows = dict(known)
+    stats = DpiStats()
+    progress.emit("start", task="extract", total=len(files), reused=len(known))
+    pipeline = ExtractPipeline(args.folder, files, args.workers)
+    for i, filename, result, error in pipeline:
+        if error is not None:
+            progress.emit("error", task="extract", index=i, file=filename, message=str(error))
+            continue
+        row, file_stats = result
+        stats.merge(file_stats)
+        manifest.record(EXTRACT_JOB, filename, row)
+        rows[filename] = row
+        progress.emit(
+            "file", task="extract", index=i, total=len(files), file=filename, source=row[-1], queues=pipeline.depths()
+        )
+    manifest.save()
+
+    table = OBRTable()
+    table.append_rows([rows[f] for f in list_pdfs(args.folder) if f in rows])
+    export_table(table, args.output)
+    progress.emit(
+        "done", task="extract", rows=len(table), output=args.output, dpi=stats.summary(),
+        queues=pipeline.depth_summary(),
+    )
+
+
+def run_rename(args, progress):
+    mode = args.mode.upper()
+    files = list_pdfs(args.folder)
+    manifest = FolderManifest(args.folder)
+    known = {}
+    if args.incremental:
+        named = [f for f in files if already_named(mode, f)]
+        files, known = manifest.partition(rename_job(mode), [f for f in files if f not in named])
+        for filename in named:
+            progress.emit("unchanged", task="rename", file=filename)
+
+    def report(filename, candidate):
+        if candidate.confident:
+            ok, message = auto_rename(candidate)
+            progress.emit("renamed" if ok else "skipped", task="rename", file=filename, message=message)
+        else:
+            # Headless runs can't ask; unconfident files are left for the review screen
+            progress.emit("review", task="rename", file=filename, suggestions=candidate.suggestions)
+
+    stats = DpiStats()
+    progress.emit("start", task="rename", mode=mode, total=len(files), reused=len(known))
+    for filename, data in known.items():
+        try:
+            report(filename, RenameCandidate.from_dict(os.path.join(args.folder, filename), mode, data))
+        except OSError as e:
+            progress.emit("error", task="rename", file=filename, message=str(e))
+    for i, filename, candidate, error in iter_analyze(mode, args.folder, files, args.workers, stats):
+        if error is not None:
+            progress.emit("error", task="rename", index=i, file=filename, message=str(error))
+            continue
+        manifest.record(rename_job(mode), filename, candidate.as_dict())
+        try:
+            report(filename, candidate)
+        except OSError as e:
+            progress.emit("error", task="rename", index=i, file=filename, message=str(e))
+    manifest.save()
+    progress.emit("done", task="rename", mode=mode, errors=progress.failures, dpi=stats.summary())
+
+
+def run_split(args, progress):
+    if os.path.isdir(args.input):
+        inputs = sorted(os.path.join(args.input, f) for f in os.listdir(args.input) if f.lower().endswith(".pdf"))
+    else:
+        inputs = [args.input]
+    mode = "ranges" if args.ranges else "chunks" if args.chunk else "bookmarks" if args.bookmarks else "pages"
+    progress.emit("start", task="split", mode=mode, inputs=len(inputs))
+    for done, total, path, error in iter_split(inputs, args.output, mode, args.ranges, args.chunk, args.workers):
+        if error is not None:
+            progress.emit("error", task="split", index=done - 1, total=total, file=path, message=str(error))
+        else:
+            progress.emit("file", task="split", index=done - 1, total=total, output=path)
+    progress.emit("done", task="split", output=args.output, errors=progress.failures)
+
+
+def run_merge(args, progress):
+    merge_pdfs(args.inputs, args.output)
+    progress.emit("done", task="merge", inputs=len(args.inputs), output=args.output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="ERC PDF Utility Tool, headless batch mode")
+    parser.add_argument("--workers", type=int, default=OCR_WORKERS, help="worker processes (OCR and split)")
+    parser.add_argument("--cache-file", default=OCR_CACHE_FILE, help="OCR cache database")
+    parser.add_argument("--no-cache", action="store_true", help="don't read or write the OCR cache")
+    parser.add_argument("--clear-cache", action="store_true", help="empty the OCR cache before running")
+    parser.add_argument("--progress", choices=("json", "text", "none"), default="json")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    extract = commands.add_parser("extract", help="extract OBR rows to CSV or XLSX")
+    extract.add_argument("folder")
+    extract.add_argument("-o", "--output", required=True, help="a .csv, .xlsx or .pdf file")
+    extract.add_argument("--incremental", action="store_true", help="reuse rows for unchanged files")
+    extract.set_defaults(func=run_extract)
+
+    rename = commands.add_parser("rename", help="rename OBR, NCA or SARO scans by their number")
+    rename.add_argument("mode", choices=("obr", "nca", "saro"))
+    rename.add_argument("folder")
+    rename.add_argument("--all", dest="incremental", action="store_false",
+                        help="re-read every file, including ones already named")
+    rename.set_defaults(func=run_rename)
+
+    split = commands.add_parser("split", help="split a PDF, or every PDF in a folder, into smaller PDFs")
+    split.add_argument("input", help="a PDF file or a folder of PDFs")
+    split.add_argument("output", help="output folder")
+    split_mode = split.add_mutually_exclusive_group()
+    split_mode.add_argument("--ranges", default="", help='one file per page range, e.g. "1-3,5,8-"')
+    split_mode.add_argument("--chunk", type=int, default=0, metavar="N", help="one file per N pages")
+    split_mode.add_argument("--bookmarks", action="store_true", help="one file per top-level bookmark")
+    split.set_defaults(func=run_split)
+
+    merge = commands.add_parser("merge", help="merge PDFs in the given order")
+    merge.add_argument("output")
+    merge.add_argument("inputs", nargs="+")
+    merge.set_defaults(func=run_merge)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "extract" and os.path.splitext(args.output)[1].lower() not in EXPORT_FORMATS:
+        parser.error("--output must be a .csv, .xlsx or .pdf file")
+    configure_cache(args.cache_file, enabled=not args.no_cache)
+    if args.clear_cache:
+        get_cache().clear()
+
+    progress = Progress(args.progress)
+    try:
+        args.func(args, progress)
+    except Exception as e:
+        progress.emit("error", task=args.command, message=str(e))
+    return 1 if progress.failures else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
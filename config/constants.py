@@ -1,7 +1,74 @@
-PRIMARY_COLOR = "#003366"
-SECONDARY_COLOR = "#00509E"
-ACCENT_COLOR = "#FFD700"
-BACKGROUND_COLOR = "#F4F6F7"
-TEXT_COLOR = "#FFFFFF"
-DEFAULT_FONT = "Segoe UI"
-FONT_SIZE = 9
+import os
+
+PRIMARY_COLOR = "#003366"
+SECONDARY_COLOR = "#00509E"
+ACCENT_COLOR = "#FFD700"
+BACKGROUND_COLOR = "#F4F6F7"
+TEXT_COLOR = "#FFFFFF"
+DEFAULT_FONT = "Segoe UI"
+FONT_SIZE = 9
+
+# OCR process pool: leave one core free for the GUI thread
+OCR_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+TESSERACT_THREADS = 1
+# Files submitted ahead of the oldest unfinished one, per worker; results are yielded in folder order
+OCR_LOOKAHEAD = 4
+
+# pdf2image renders at 200 DPI unless told otherwise
+DEFAULT_DPI = 200
+
+OCR_CACHE_FILE = "ocr_cache.sqlite"
+OCR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# "auto" uses the in-process tesserocr engine when installed, else the tesseract executable
+OCR_BACKEND = "auto"
+OCR_ENGINE_POOL_SIZE = 2
+
+# Rendered page images for the crop viewer and rename previews
+PAGE_CACHE_DIR = "page_cache"
+PAGE_CACHE_MEMORY_BYTES = 64 * 1024 * 1024
+PAGE_CACHE_DISK_BYTES = 512 * 1024 * 1024
+PAGE_CACHE_HOT_PAGES = 2
+
+# Adaptive rasterization: field regions use each form profile's DPI tiers,
+# whole-page OCR falls back through these
+FULL_PAGE_DPI_TIERS = (DEFAULT_DPI, 300)
+OCR_MIN_CONFIDENCE = 60
+
+# Per-folder record of processed files for incremental re-runs; bump the
+# rule version whenever parsers or form profiles change so old results are redone
+MANIFEST_FILE = ".obr_manifest.json"
+MANIFEST_RULE_VERSION = 2
+
+# OBR table columns, shared by the extractor window and the command-line export
+OBR_COLUMNS = ["File Name", "Serial No.", "Date", "Payee", "Particulars",
+               "Total Amount", "Payment", "Tax", "Balance", "Remarks", "Source"]
+
+# Staged extraction: render threads feed the OCR pool through a bounded queue
+PIPELINE_RENDER_THREADS = 2
+PIPELINE_QUEUE_SIZE = 2 * OCR_WORKERS
+
+# Extraction results reach the OBR table in batches of up to this many rows, or every interval (seconds)
+ROW_BATCH_SIZE = 500
+ROW_BATCH_INTERVAL = 0.25
+
+# OBR table search runs this long (ms) after the last keystroke
+SEARCH_DEBOUNCE_MS = 250
+
+# OBR table undo history: oldest commands are dropped past either cap
+EDIT_HISTORY_MAX_ENTRIES = 500
+EDIT_HISTORY_MAX_BYTES = 32 * 1024 * 1024
+# Audit trail of individual cell edits kept for the session
+EDIT_LOG_MAX_ENTRIES = 10000
+
+# Lines kept in the OBR extractor's log panel; the full log goes to edit_log_<user>.csv
+LOG_VIEW_MAX_LINES = 1000
+
+# Per-user SQLite copy of the OBR table (extracted rows plus an edit journal)
+SESSION_FILE_TEMPLATE = "obr_session_{user}.sqlite"
+# The edit journal is folded into the stored rows once it holds this many entries
+SESSION_COMPACT_EDITS = 5000
+
+# PDF split engine: output files are written on a process pool once a job has enough pages
+SPLIT_WORKERS = OCR_WORKERS
+SPLIT_PARALLEL_MIN_PAGES = 50
@@ -0,0 +1,92 @@
+import json
+
+from core.ocr_backends import image_to_string, image_to_words
+from core.ocr_cache import get_cache, make_key
+from core.rasterize import render_region, page_size_points
+from core.cancellation import check_cancelled
+
+# How many anchor-line heights above the anchor line the re-read strip covers
+ANCHOR_STRIP_LINES = 2.5
+
+
+def words_to_lines(words):
+    """Groups word boxes into [(text, top, bottom), ...] in reading order."""
+    lines = {}
+    for text, left, top, right, bottom, conf, line in words:
+        parts, line_top, line_bottom = lines.get(line, ([], top, bottom))
+        parts.append(text)
+        lines[line] = (parts, min(line_top, top), max(line_bottom, bottom))
+    return [(" ".join(parts), top, bottom) for parts, top, bottom in (lines[k] for k in sorted(lines))]
+
+
+def strip_above(box, image_height, top, bottom):
+    """Page-fraction box for the strip just above a line found at pixel rows top..bottom of `box`."""
+    scale = (box[3] - box[1]) / image_height
+    strip_top = max(0, top - ANCHOR_STRIP_LINES * (bottom - top))
+    return (box[0], box[1] + strip_top * scale, box[2], box[1] + top * scale)
+
+
+def anchor_text(path, profile, field, anchor, parse_line, stats=None, should_stop=None):
+    """
+    Reads the value printed on the line above `anchor` inside the profile's field box.
+
+    The box is OCR'd at the lowest DPI tier to find the anchor line. If the line
+    above it doesn't parse, only a thin strip above the anchor is re-rendered at
+    the higher tiers; the whole box is re-read only while the anchor is missing.
+    Each read goes through the OCR cache, so a rerun renders nothing it has read before.
+    Returns the parsed value or None.
+    """
+    cache = get_cache()
+    digest = cache.file_digest(path)
+    value_key = make_key("anchor", digest, profile.page, profile.box(field), anchor)
+    value = cache.get(value_key)
+    if value:
+        return value
+
+    box = profile.box(field)
+    config = profile.field_config(field)
+    size = None
+    strip = None
+    for dpi in profile.dpi_tiers:
+        check_cancelled(should_stop)
+        value = None
+        if strip is None:
+            # Word boxes are cached as JSON along with the height they were measured at
+            key = make_key("words", digest, profile.page, dpi, profile.lang, config, box)
+            read = cache.get(key)
+            if read is None:
+                size = size or page_size_points(path, profile.page)
+                image = render_region(path, profile.page, box, dpi, size)
+                read = json.dumps({"height": image.height, "words": image_to_words(image, lang=profile.lang, config=config)})
+                cache.put(key, read)
+            read = json.loads(read)
+            height = read["height"]
+            lines = words_to_lines(read["words"])
+            for i, (text, top, bottom) in enumerate(lines):
+                if anchor in text:
+                    value = parse_line(lines[i - 1][0]) if i > 0 else None
+                    strip = strip_above(box, height, top, bottom)
+                    break
+        else:
+            key = make_key("region", digest, profile.page, dpi, profile.lang, config, strip)
+            text = cache.get(key)
+            if text is None:
+                size = size or page_size_points(path, profile.page)
+                image = render_region(path, profile.page, strip, dpi, size)
+                text = image_to_string(image, lang=profile.lang, config=config)
+                cache.put(key, text)
+            # Nearest line to the anchor first
+            for line in reversed([line.strip() for line in text.splitlines() if line.strip()]):
+                value = parse_line(line)
+                if value:
+                    break
+
+        if value:
+            if stats is not None:
+                stats.record("anchor", dpi)
+            cache.put(value_key, value)
+            return value
+
+    if stats is not None:
+        stats.record_failure("anchor")
+    return None
@@ -0,0 +1,8 @@
+class OperationCancelled(Exception):
+    pass
+
+
+def check_cancelled(should_stop):
+    """Raises OperationCancelled if the caller's `should_stop()` says so; lets long jobs stop mid-file."""
+    if should_stop is not None and should_stop():
+        raise OperationCancelled()
@@ -0,0 +1,39 @@
+import threading
+from collections import Counter
+
+
+class DpiStats:
+    """Per-run counts of which DPI tier finally produced a usable read, per OCR stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.successes = Counter()
+        self.failures = Counter()
+
+    def record(self, stage, dpi):
+        with self._lock:
+            self.successes[(stage, dpi)] += 1
+
+    def record_failure(self, stage):
+        with self._lock:
+            self.failures[stage] += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "successes": [[stage, dpi, n] for (stage, dpi), n in self.successes.items()],
+                "failures": dict(self.failures),
+            }
+
+    def merge(self, data):
+        with self._lock:
+            for stage, dpi, n in data.get("successes", []):
+                self.successes[(stage, dpi)] += n
+            for stage, n in data.get("failures", {}).items():
+                self.failures[stage] += n
+
+    def summary(self):
+        with self._lock:
+            parts = [f"{stage} @ {dpi} DPI: {n}" for (stage, dpi), n in sorted(self.successes.items())]
+            parts += [f"{stage} failed at every tier: {n}" for stage, n in sorted(self.failures.items())]
+        return ", ".join(parts) if parts else "no OCR needed"
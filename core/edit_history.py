@@ -0,0 +1,126 @@
+import sys
+from array import array
+from collections import deque
+
+from config.constants import EDIT_HISTORY_MAX_ENTRIES, EDIT_HISTORY_MAX_BYTES
+
+
+class EditCommand:
+    """
+    One undoable change, e.g. an edit with the balance it recalculated or a
+    whole paste. Cells are stored as parallel columns: row/column numbers in
+    arrays and before/after text in tuples. Cells left unchanged are dropped.
+    """
+
+    __slots__ = ("label", "rows", "cols", "old", "new", "nbytes")
+
+    def __init__(self, label, changes=()):
+        self.label = label
+        self.rows = array("l")
+        self.cols = array("B")
+        self.old = ()
+        self.new = ()
+        self.nbytes = 0
+        self.extend(changes)
+
+    def extend(self, changes):
+        """Adds (row, col, old, new) cells; applied after the ones already held."""
+        changes = [change for change in changes if change[2] != change[3]]
+        if not changes:
+            return
+        self.rows.extend(row for row, _, _, _ in changes)
+        self.cols.extend(col for _, col, _, _ in changes)
+        self.old += tuple(old for _, _, old, _ in changes)
+        self.new += tuple(new for _, _, _, new in changes)
+        self.nbytes = (
+            self.rows.itemsize * len(self.rows) + len(self.cols)
+            + sum(map(sys.getsizeof, self.old)) + sum(map(sys.getsizeof, self.new))
+        )
+
+    def __len__(self):
+        return len(self.rows)
+
+    def undo_cells(self):
+        """(row, col, text) restoring the state before the command, latest change first."""
+        return list(zip(self.rows[::-1], self.cols[::-1], self.old[::-1]))
+
+    def redo_cells(self):
+        return list(zip(self.rows, self.cols, self.new))
+
+    def reorder(self, position):
+        self.rows = array("l", (position[row] for row in self.rows))
+
+
+class EditHistory:
+    """
+    Undo/redo stacks of EditCommands. A new command clears the redo stack, and
+    the oldest commands are dropped once either the entry or the byte cap is
+    exceeded (the newest command is always kept).
+    """
+
+    def __init__(self, max_entries=EDIT_HISTORY_MAX_ENTRIES, max_bytes=EDIT_HISTORY_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self):
+        self._undo = deque()
+        self._redo = []
+        self.nbytes = 0
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def push(self, label, changes):
+        """Records (row, col, old, new) cells as one command; returns it, or None if nothing changed."""
+        command = EditCommand(label, changes)
+        if not len(command):
+            return None
+        self.nbytes -= sum(c.nbytes for c in self._redo)
+        self._redo = []
+        self._undo.append(command)
+        self.nbytes += command.nbytes
+        self._evict()
+        return command
+
+    def amend(self, changes):
+        """Adds cells to the latest command, e.g. the balance an edit recalculated."""
+        if not self._undo:
+            return
+        command = self._undo[-1]
+        self.nbytes -= command.nbytes
+        command.extend(changes)
+        self.nbytes += command.nbytes
+        self._evict()
+
+    def undo(self):
+        """The command to revert (its undo_cells), or None."""
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        self._redo.append(command)
+        return command
+
+    def redo(self):
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        self._undo.append(command)
+        return command
+
+    def reorder(self, order):
+        """Follows a table sort that put old row order[i] at row i."""
+        position = array("l", [0]) * len(order)
+        for new, old in enumerate(order):
+            position[old] = new
+        for command in list(self._undo) + self._redo:
+            command.reorder(position)
+
+    def _evict(self):
+        while len(self._undo) > 1 and (
+            len(self._undo) + len(self._redo) > self.max_entries or self.nbytes > self.max_bytes
+        ):
+            self.nbytes -= self._undo.popleft().nbytes
@@ -0,0 +1,227 @@
+import re
+
+from config.constants import OCR_MIN_CONFIDENCE
+from core.ocr_cache import get_cache, make_key
+from core.rasterize import render_region, crop_fraction
+from core.ocr_batch import ocr_crops
+from core.rename_parsers import OBR_SERIAL_PATTERN
+from core.cancellation import check_cancelled
+
+
+class FormProfile:
+    """
+    Where the fields of one document type sit on the page. Boxes are
+    (left, top, right, bottom) page fractions so they hold at any DPI.
+    Fields are OCR'd at the first DPI tier and only re-rendered at the
+    next tier when their validator regex misses or confidence is low.
+    """
+
+    def __init__(self, name, page, dpi_tiers, fields, lang="eng", config="--psm 6", preview=None, validators=None):
+        self.name = name
+        self.page = page
+        self.dpi_tiers = tuple(dpi_tiers)
+        self.lang = lang
+        self.config = config
+        # field name -> (box, tesseract config or None for the profile default)
+        self.fields = fields
+        self.preview = preview
+        # field name -> regex the OCR'd text must contain to count as read
+        self.validators = validators or {}
+
+    @property
+    def dpi(self):
+        return self.dpi_tiers[0]
+
+    def box(self, field):
+        return self.fields[field][0]
+
+    def field_config(self, field):
+        return self.fields[field][1] or self.config
+
+    def field_ok(self, field, text, conf):
+        if conf is not None and conf < OCR_MIN_CONFIDENCE:
+            return False
+        pattern = self.validators.get(field)
+        return bool(text.strip()) and (pattern is None or re.search(pattern, text) is not None)
+
+
+FORM_PROFILES = {
+    "OBR": FormProfile(
+        "OBR", page=1, dpi_tiers=(120, 200, 300),
+        fields={
+            "serial": ((0.55, 0.05, 1.0, 0.18), None),
+            "date": ((0.55, 0.10, 1.0, 0.22), None),
+            "payee": ((0.0, 0.15, 0.75, 0.27), None),
+            "particulars": ((0.1, 0.30, 0.6, 0.60), None),
+            "total": ((0.6, 0.55, 1.0, 0.68), None),
+        },
+        preview=(0.5, 0.0, 1.0, 0.5),
+        validators={
+            "serial": OBR_SERIAL_PATTERN,
+            "date": r"[A-Za-z]+\s+\d{1,2},\s+\d{4}",
+            "payee": r"(?i)payee",
+            "particulars": r"(?i)to obligate",
+            # The parser only trusts a labelled total; a bare amount here may be any line item
+            "total": r"Total\s*[:\s]*\d[\d,]*\.\d{2}",
+        },
+    ),
+    "NCA": FormProfile(
+        "NCA", page=1, dpi_tiers=(150, 200, 300),
+        fields={
+            # NCA number sits on the line above the "2067" anchor in the header block
+            "number": ((0.0, 0.0, 1.0, 0.35), None),
+        },
+        preview=(0.0, 0.0, 1.0, 0.4),
+        validators={"number": r"2067"},
+    ),
+    "SARO": FormProfile(
+        "SARO", page=1, dpi_tiers=(150, 200, 300),
+        fields={
+            "number": ((0.5, 0.7, 1.0, 1.0), "--psm 3"),
+        },
+        config="--psm 3",
+        preview=(0.3, 0.65, 1.0, 1.0),
+        validators={"number": r"SARO|[A-Z]-\d{2}-\d{5}"},
+    ),
+}
+
+
+def get_profile(name):
+    return FORM_PROFILES[name.upper()]
+
+
+def union_box(boxes):
+    boxes = list(boxes)
+    return (
+        min(b[0] for b in boxes), min(b[1] for b in boxes),
+        max(b[2] for b in boxes), max(b[3] for b in boxes),
+    )
+
+
+def relative_box(box, outer):
+    width, height = outer[2] - outer[0], outer[3] - outer[1]
+    return (
+        (box[0] - outer[0]) / width, (box[1] - outer[1]) / height,
+        (box[2] - outer[0]) / width, (box[3] - outer[1]) / height,
+    )
+
+
+def prepare_field_crops(doc_key, path, profile, fields, dpi):
+    """
+    Render half of region OCR: returns ({field: (cached text, None)}, crops, keys) where
+    crops is {(doc_key, field): (lang, config, image)} for the fields the cache doesn't have.
+    """
+    cache = get_cache()
+    digest = cache.file_digest(path)
+    texts, missing, crops, keys = {}, [], {}, {}
+    for f in fields:
+        keys[(doc_key, f)] = make_key(
+            "region", digest, profile.page, dpi, profile.lang, profile.field_config(f), profile.box(f)
+        )
+        text = cache.get(keys[(doc_key, f)])
+        if text is None:
+            missing.append(f)
+        else:
+            texts[f] = (text, None)
+
+    if missing:
+        # One render covering every missing field, then crop each field out of it
+        outer = union_box(profile.box(f) for f in missing)
+        region = render_region(path, profile.page, outer, dpi)
+        for f in missing:
+            crops[(doc_key, f)] = (
+                profile.lang, profile.field_config(f), crop_fraction(region, relative_box(profile.box(f), outer))
+            )
+    return texts, crops, keys
+
+
+def ocr_field_crops(crops, keys):
+    """OCR half of region OCR: {(doc_key, field): (text, confidence)}, caching confident reads."""
+    cache = get_cache()
+    results = {}
+    # Crops share a montage only when they are read with the same language and Tesseract config
+    for lang, config in set((lang, config) for lang, config, _ in crops.values()):
+        batch = [(key, image) for key, (crop_lang, crop_config, image) in crops.items()
+                 if (crop_lang, crop_config) == (lang, config)]
+        for key, (text, conf) in ocr_crops(batch, lang=lang, config=config).items():
+            results[key] = (text, conf)
+            # Low-confidence reads are not cached so the next run tries them again
+            if conf >= OCR_MIN_CONFIDENCE:
+                cache.put(keys[key], text)
+    return results
+
+
+def ocr_fields_many(jobs, dpi=None):
+    """
+    OCR the profile field regions of many documents with as few Tesseract calls
+    as possible. `jobs` is [(doc_key, path, profile, fields or None), ...] and
+    `dpi` defaults to each profile's first tier. Returns
+    {doc_key: {field: (text, confidence)}}; confidence is None for cached text.
+    """
+    results, keys, crops = {}, {}, {}
+    for doc_key, path, profile, fields in jobs:
+        fields = list(fields or profile.fields)
+        texts, doc_crops, doc_keys = prepare_field_crops(doc_key, path, profile, fields, dpi or profile.dpi)
+        results[doc_key] = texts
+        crops.update(doc_crops)
+        keys.update(doc_keys)
+
+    for (doc_key, f), result in ocr_field_crops(crops, keys).items():
+        results[doc_key][f] = result
+    return results
+
+
+def adaptive_ocr_fields(path, profile, fields=None, accept=None, stats=None, should_stop=None):
+    """
+    OCR the field regions at the profile's lowest DPI tier, then re-render only
+    the fields that failed their validator or came back with low confidence at
+    the next tier. Returns ({field: text}, dpi of the last tier used).
+    """
+    fields = list(fields or profile.fields)
+    texts, remaining, dpi = {}, fields, profile.dpi
+    for dpi in profile.dpi_tiers:
+        check_cancelled(should_stop)
+        results = ocr_fields_many([(path, path, profile, remaining)], dpi=dpi)[path]
+        failed = []
+        for f in remaining:
+            text, conf = results[f]
+            texts[f] = text
+            if not profile.field_ok(f, text, conf):
+                failed.append(f)
+
+        joined = "\n".join(texts[f] for f in fields)
+        if not failed and (accept is None or accept(joined)):
+            if stats is not None:
+                stats.record("regions", dpi)
+            return texts, dpi
+        # Every field looks fine but the parser still rejects the page: escalate them all
+        remaining = failed or fields
+
+    if stats is not None:
+        stats.record_failure("regions")
+    return texts, dpi
+
+
+def ocr_fields(path, profile, fields=None, image=None):
+    """
+    OCR only the profile's field regions and return {field: text}. If `image`
+    (the full rendered page) is given the regions are cropped from it instead.
+    """
+    fields = list(fields or profile.fields)
+    if image is not None:
+        texts = {}
+        for config in set(profile.field_config(f) for f in fields):
+            crops = [(f, crop_fraction(image, profile.box(f))) for f in fields if profile.field_config(f) == config]
+            texts.update({f: text for f, (text, _) in ocr_crops(crops, lang=profile.lang, config=config).items()})
+        return texts
+    texts, _ = adaptive_ocr_fields(path, profile, fields)
+    return texts
+
+
+def profile_text(path, profile, fields=None, image=None, accept=None, stats=None, should_stop=None):
+    fields = list(fields or profile.fields)
+    if image is not None:
+        texts = ocr_fields(path, profile, fields, image)
+    else:
+        texts, _ = adaptive_ocr_fields(path, profile, fields, accept, stats, should_stop)
+    return "\n".join(texts[f] for f in fields)
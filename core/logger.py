@@ -1,15 +1,26 @@
-import csv
-from datetime import datetime
-
-def log_action(username, action, filenames=None):
-    filenames = ", ".join(filenames) if filenames else ""
-    log_file = f"activity_log_{username}.csv"
-
-    with open(log_file, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            username,
-            action,
-            filenames
-        ])
+import csv
+from datetime import datetime
+
+def log_action(username, action, filenames=None):
+    filenames = ", ".join(filenames) if filenames else ""
+    log_file = f"activity_log_{username}.csv"
+
+    with open(log_file, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            username,
+            action,
+            filenames
+        ])
+
+
+def log_messages(username, messages):
+    """Appends (timestamp, message) pairs to the user's edit log in one write."""
+    log_file = f"edit_log_{username}.csv"
+
+    with open(log_file, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerows(
+            [timestamp.strftime("%Y-%m-%d %H:%M:%S"), username, message] for timestamp, message in messages
+        )
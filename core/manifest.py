@@ -0,0 +1,96 @@
+import os
+import sys
+import json
+import threading
+
+from config.constants import MANIFEST_FILE, MANIFEST_RULE_VERSION
+
+
+class FolderManifest:
+    """
+    Remembers, per folder and per job ("extract", "rename-OBR", ...), which files
+    were processed, under which rule version, and what came out. A file counts
+    as done only while its size and mtime are unchanged.
+    """
+
+    def __init__(self, folder, rule_version=MANIFEST_RULE_VERSION):
+        self.folder = folder
+        self.path = os.path.join(folder, MANIFEST_FILE)
+        self.rule_version = rule_version
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._jobs = json.load(f).get("jobs", {})
+        except (OSError, ValueError):
+            self._jobs = {}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({"jobs": self._jobs}, ensure_ascii=False)
+            self._dirty = False
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            # stderr, not stdout: the command-line tool's progress stream is on stdout
+            print(f"Could not save manifest {self.path}: {e}", file=sys.stderr)
+
+    def identity(self, filename):
+        st = os.stat(os.path.join(self.folder, filename))
+        return [st.st_size, st.st_mtime_ns]
+
+    def lookup(self, job, filename):
+        """The stored result if the file is unchanged since it was recorded, else None."""
+        with self._lock:
+            entry = self._jobs.get(job, {}).get(filename)
+        if not entry or entry.get("rules") != self.rule_version:
+            return None
+        try:
+            if entry.get("identity") != self.identity(filename):
+                return None
+        except OSError:
+            return None
+        return entry.get("result")
+
+    def record(self, job, filename, result):
+        try:
+            identity = self.identity(filename)
+        except OSError:
+            return
+        with self._lock:
+            self._jobs.setdefault(job, {})[filename] = {
+                "identity": identity, "rules": self.rule_version, "result": result,
+            }
+            self._dirty = True
+
+    def forget(self, job, filename):
+        with self._lock:
+            if self._jobs.get(job, {}).pop(filename, None) is not None:
+                self._dirty = True
+
+    def partition(self, job, files):
+        """Splits `files` into (files still to process, {filename: stored result})."""
+        todo, done = [], {}
+        for filename in files:
+            result = self.lookup(job, filename)
+            if result is None:
+                todo.append(filename)
+            else:
+                done[filename] = result
+        with self._lock:
+            # Drop entries for files that are gone so the manifest doesn't grow forever
+            present = set(files)
+            stale = [f for f in self._jobs.get(job, {}) if f not in present]
+            for filename in stale:
+                del self._jobs[job][filename]
+            self._dirty = self._dirty or bool(stale)
+        return todo, done
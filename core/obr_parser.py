@@ -0,0 +1,77 @@
+import os
+import re
+
+TOTAL_PATTERN = re.compile(r"Total\s*[:\s]*([\d,]+\.\d{2})")
+
+
+def parse_obr_text(text, filename, total_text=None):
+    # `total_text` is the total field's own read; an unlabelled total is summed from it rather than the whole text
+    serial = os.path.splitext(filename)[0]
+
+    date_match = re.search(r"(?:Date\s*[:\-]?\s*)([A-Za-z]+\s+\d{1,2},\s+\d{4})", text, re.IGNORECASE)
+    date = date_match.group(1) if date_match else ""
+
+    payee = ""
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        match = re.search(r"Payee\s*[:\-]?\s*(.+)", line, re.IGNORECASE)
+        if match and match.group(1).strip():
+            payee = match.group(1).strip()
+            break
+        if re.match(r"^\s*Payee\s*[:\-]?\s*$", line, re.IGNORECASE) and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if next_line:
+                payee = next_line
+                break
+
+    particulars_lines = []
+    is_collecting = False
+    blank_line_count = 0
+
+    for line in lines:
+        stripped = line.strip()
+        lower = stripped.lower()
+        if not is_collecting and "to obligate" in lower:
+            match = re.search(r"(To obligate.*)", stripped, re.IGNORECASE)
+            if match:
+                particulars_lines.append(match.group(1).strip())
+                is_collecting = True
+            continue
+
+        if is_collecting:
+            if any(kw in lower for kw in ["certified", "signature", "position", "printed name", "head", "date:", "status of obligation"]):
+                break
+            # Joined region reads put the total line straight after the particulars
+            if TOTAL_PATTERN.match(stripped):
+                break
+            if not stripped:
+                blank_line_count += 1
+                if blank_line_count >= 2:
+                    break
+                continue
+            else:
+                blank_line_count = 0
+                particulars_lines.append(stripped)
+
+    full_particulars = " ".join(particulars_lines)
+    cleaned = re.split(r"\s+\d{10,}|\s+\d{3,}\.\d{2}|\|\s*\d+", full_particulars)[0].strip()
+
+    total_match = TOTAL_PATTERN.search(text)
+    if total_match:
+        total_amount = f"{float(total_match.group(1).replace(',', '')):,.2f}"
+    else:
+        amounts = [float(a.replace(",", "")) for a in re.findall(r"(\d{1,3}(?:,\d{3})*\.\d{2})", text if total_text is None else total_text)]
+        total_amount = f"{sum(amounts):,.2f}"
+
+    return [filename, serial, date, payee, cleaned, total_amount, "", "", total_amount]
+
+
+def has_required_fields(row):
+    # Date, payee and a non-zero total are what the OBR table needs from the page
+    return bool(row[2] and row[3] and row[5] != "0.00")
+
+
+
+def has_region_fields(row, text):
+    # Region boxes are approximate, so a region read also needs particulars and a labelled total
+    return has_required_fields(row) and bool(row[4]) and TOTAL_PATTERN.search(text) is not None
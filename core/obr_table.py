@@ -0,0 +1,160 @@
+import sys
+import math
+from array import array
+
+from config.constants import OBR_COLUMNS
+
+# Total Amount, Payment, Tax, Balance
+AMOUNT_COLUMNS = (5, 6, 7, 8)
+# Low-cardinality text columns; equal strings share one object
+INTERNED_COLUMNS = (2, 3, 9, 10)
+BLANK = float("nan")
+
+
+def parse_amount_text(text):
+    """float for "1,234.00", BLANK for "", None if the text isn't an amount."""
+    text = (text or "").strip().replace(",", "")
+    if not text:
+        return BLANK
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def format_amount(value):
+    return "" if math.isnan(value) else f"{value:,.2f}"
+
+
+def to_cents(value):
+    return 0 if math.isnan(value) else round(value * 100)
+
+
+class OBRTable:
+    """
+    Column store behind the OBR table. Amounts live in float arrays (NaN for a
+    blank cell), payee/date/remarks/source are interned strings and the rest are
+    plain string lists. Text typed into an amount column that isn't a number is
+    kept as-is in a small side table and counts as zero.
+
+    Column totals are kept as running sums in whole cents, adjusted by the
+    difference on every change, so they never need a pass over the rows.
+    """
+
+    def __init__(self, columns=OBR_COLUMNS):
+        self.columns = list(columns)
+        self.clear()
+
+    def clear(self):
+        self._cols = [
+            array("d") if col in AMOUNT_COLUMNS else [] for col in range(len(self.columns))
+        ]
+        self._invalid = {}
+        self._cents = dict.fromkeys(AMOUNT_COLUMNS, 0)
+
+    def __len__(self):
+        return len(self._cols[0])
+
+    def copy(self):
+        """A snapshot that later edits, sorts and clears of this table don't touch."""
+        table = OBRTable.__new__(OBRTable)
+        table.columns = list(self.columns)
+        table._cols = [column[:] for column in self._cols]
+        table._invalid = dict(self._invalid)
+        table._cents = dict(self._cents)
+        return table
+
+    def append_rows(self, rows):
+        for data in rows:
+            row = len(self)
+            for col, column in enumerate(self._cols):
+                text = data[col] if col < len(data) and data[col] is not None else ""
+                if col in AMOUNT_COLUMNS:
+                    value = parse_amount_text(text)
+                    if value is None:
+                        self._invalid[(row, col)] = text
+                        value = BLANK
+                    column.append(value)
+                    self._cents[col] += to_cents(value)
+                else:
+                    column.append(sys.intern(text) if col in INTERNED_COLUMNS else text)
+
+    def text(self, row, col):
+        if col in AMOUNT_COLUMNS:
+            invalid = self._invalid.get((row, col))
+            return invalid if invalid is not None else format_amount(self._cols[col][row])
+        return self._cols[col][row]
+
+    def amount(self, row, col):
+        """Numeric value of an amount cell; blanks and non-numbers count as zero."""
+        value = self._cols[col][row]
+        return 0.0 if math.isnan(value) else value
+
+    def amounts(self, col):
+        """The raw float column (NaN for blanks); read-only use."""
+        return self._cols[col]
+
+    def invalid_texts(self, col):
+        """Text kept as typed in amount column `col` because it isn't a number ("N/A", ...)."""
+        return [text for (_, c), text in self._invalid.items() if c == col]
+
+    def set_text(self, row, col, text):
+        text = text if text is not None else ""
+        if col in AMOUNT_COLUMNS:
+            value = parse_amount_text(text)
+            if value is None:
+                self._invalid[(row, col)] = text
+                value = BLANK
+            else:
+                self._invalid.pop((row, col), None)
+            self._set_amount(row, col, value)
+        else:
+            self._cols[col][row] = sys.intern(text) if col in INTERNED_COLUMNS else text
+
+    def row_texts(self, row):
+        return [self.text(row, col) for col in range(len(self.columns))]
+
+    def rows(self):
+        for row in range(len(self)):
+            yield self.row_texts(row)
+
+    def _set_amount(self, row, col, value):
+        self._cents[col] += to_cents(value) - to_cents(self._cols[col][row])
+        self._cols[col][row] = value
+
+    def recalculate_balance(self, row):
+        balance = self.amount(row, 5) - self.amount(row, 6) - self.amount(row, 7)
+        self._invalid.pop((row, 8), None)
+        self._set_amount(row, 8, balance)
+
+    def totals(self):
+        """Sums of the amount columns, in AMOUNT_COLUMNS order."""
+        return [self._cents[col] / 100 for col in AMOUNT_COLUMNS]
+
+    def totals_texts(self):
+        texts = ["TOTAL"] + [""] * (len(self.columns) - 1)
+        for col, value in zip(AMOUNT_COLUMNS, self.totals()):
+            texts[col] = f"{value:,.2f}"
+        return texts
+
+    def sort(self, col, descending=False):
+        if col in AMOUNT_COLUMNS:
+            values = self._cols[col]
+            # Blanks sort last either way
+            key = lambda i: (math.isnan(values[i]), -values[i] if descending else values[i])
+            order = sorted(range(len(self)), key=key)
+        else:
+            values = self._cols[col]
+            order = sorted(range(len(self)), key=lambda i: values[i].lower(), reverse=descending)
+        self.reorder(order)
+        return order
+
+    def reorder(self, order):
+        """Puts old row order[i] at row i."""
+        if len(order) != len(self):
+            raise ValueError(f"order has {len(order)} rows, table has {len(self)}")
+        for col, column in enumerate(self._cols):
+            reordered = [column[i] for i in order]
+            self._cols[col] = array("d", reordered) if col in AMOUNT_COLUMNS else reordered
+        position = {old: new for new, old in enumerate(order)}
+        self._invalid = {(position[row], col): text for (row, col), text in self._invalid.items()}
@@ -0,0 +1,193 @@
+import os
+import queue
+import shlex
+import threading
+import importlib.util
+
+import pytesseract
+
+from config.constants import OCR_BACKEND, OCR_ENGINE_POOL_SIZE, TESSERACT_THREADS
+
+# Imported on first use by load_tesserocr(), not here: libgomp reads OMP_THREAD_LIMIT
+# once, when libtesseract is loaded, so the limit has to be in place before that
+tesserocr = None
+
+
+def tesserocr_available():
+    return tesserocr is not None or importlib.util.find_spec("tesserocr") is not None
+
+
+def load_tesserocr():
+    global tesserocr
+    if tesserocr is None:
+        os.environ.setdefault("OMP_THREAD_LIMIT", str(TESSERACT_THREADS))
+        import tesserocr as module
+        tesserocr = module
+    return tesserocr
+
+
+def parse_tesseract_config(config):
+    """Splits a pytesseract-style config string into (psm, oem, {variable: value})."""
+    psm, oem, variables = None, None, {}
+    args = shlex.split(config or "")
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--psm" and i + 1 < len(args):
+            psm = int(args[i + 1])
+            i += 1
+        elif arg == "--oem" and i + 1 < len(args):
+            oem = int(args[i + 1])
+            i += 1
+        elif arg == "-c" and i + 1 < len(args) and "=" in args[i + 1]:
+            key, value = args[i + 1].split("=", 1)
+            variables[key] = value
+            i += 1
+        i += 1
+    return psm, oem, variables
+
+
+class PytesseractBackend:
+    """Spawns the tesseract executable for every call. Always available."""
+
+    name = "pytesseract"
+
+    def image_to_string(self, image, lang="eng", config=""):
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def image_to_words(self, image, lang="eng", config=""):
+        data = pytesseract.image_to_data(image, lang=lang, config=config, output_type=pytesseract.Output.DICT)
+        words, lines = [], {}
+        for i, text in enumerate(data["text"]):
+            text = text.strip()
+            if not text:
+                continue
+            line = lines.setdefault((data["block_num"][i], data["par_num"][i], data["line_num"][i]), len(lines))
+            left, top = data["left"][i], data["top"][i]
+            words.append((text, left, top, left + data["width"][i], top + data["height"][i], float(data["conf"][i]), line))
+        return words
+
+    def close(self):
+        pass
+
+
+class TesserocrBackend:
+    """
+    Keeps a small pool of in-process Tesseract engines per language so the
+    traineddata is loaded once and images are passed straight from memory.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, pool_size=OCR_ENGINE_POOL_SIZE):
+        if not tesserocr_available():
+            raise RuntimeError("tesserocr is not installed")
+        load_tesserocr()
+        self.pool_size = pool_size
+        self._pools = {}
+        self._created = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, lang, oem):
+        key = (lang, oem)
+        with self._lock:
+            pool = self._pools.setdefault(key, queue.LifoQueue())
+            try:
+                return pool.get_nowait()
+            except queue.Empty:
+                pass
+            if self._created.get(key, 0) < self.pool_size:
+                self._created[key] = self._created.get(key, 0) + 1
+                if oem is None:
+                    return tesserocr.PyTessBaseAPI(lang=lang)
+                return tesserocr.PyTessBaseAPI(lang=lang, oem=oem)
+        return pool.get()
+
+    def _release(self, lang, oem, api):
+        self._pools[(lang, oem)].put(api)
+
+    def image_to_string(self, image, lang="eng", config=""):
+        return self._run(image, lang, config, words=False)
+
+    def image_to_words(self, image, lang="eng", config=""):
+        return self._run(image, lang, config, words=True)
+
+    @staticmethod
+    def _words(api):
+        api.Recognize()
+        words, line = [], -1
+        level = tesserocr.RIL.WORD
+        for it in tesserocr.iterate_level(api.GetIterator(), level):
+            text = (it.GetUTF8Text(level) or "").strip()
+            if it.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+                line += 1
+            if not text:
+                continue
+            left, top, right, bottom = it.BoundingBox(level)
+            words.append((text, left, top, right, bottom, it.Confidence(level), max(line, 0)))
+        return words
+
+    def _run(self, image, lang, config, words):
+        psm, oem, variables = parse_tesseract_config(config)
+        api = self._acquire(lang, oem)
+        previous = {}
+        try:
+            api.SetPageSegMode(tesserocr.PSM.AUTO if psm is None else psm)
+            for key, value in variables.items():
+                previous[key] = api.GetVariableAsString(key)
+                api.SetVariable(key, value)
+            api.SetImage(image)
+            if words:
+                return self._words(api)
+            return api.GetUTF8Text()
+        finally:
+            # Engines are shared, so -c variables must not leak into the next caller
+            for key, value in previous.items():
+                if value is not None:
+                    api.SetVariable(key, value)
+            api.Clear()
+            self._release(lang, oem, api)
+
+    def close(self):
+        with self._lock:
+            for pool in self._pools.values():
+                while not pool.empty():
+                    pool.get_nowait().End()
+            self._pools.clear()
+            self._created.clear()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name=OCR_BACKEND):
+    if name == "tesserocr" or (name == "auto" and tesserocr_available()):
+        return TesserocrBackend()
+    return PytesseractBackend()
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend()
+        return _backend
+
+
+def set_backend(name):
+    global _backend
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+        _backend = create_backend(name)
+        return _backend
+
+
+def image_to_string(image, lang="eng", config=""):
+    return get_backend().image_to_string(image, lang=lang, config=config)
+
+
+def image_to_words(image, lang="eng", config=""):
+    """Word boxes as (text, left, top, right, bottom, confidence, line number) tuples."""
+    return get_backend().image_to_words(image, lang=lang, config=config)
@@ -0,0 +1,80 @@
+from PIL import Image
+
+from core.ocr_backends import image_to_words
+
+# White gap between stacked crops; wide enough that Tesseract never joins lines across crops
+MONTAGE_GAP = 40
+MONTAGE_MARGIN = 10
+# Tesseract rejects images taller than 32767 px
+MONTAGE_MAX_HEIGHT = 30000
+# Only used when a caller has no per-field config of its own
+MONTAGE_CONFIG = "--psm 4"
+
+
+def build_montages(crops, gap=MONTAGE_GAP, margin=MONTAGE_MARGIN, max_height=MONTAGE_MAX_HEIGHT):
+    """
+    Stacks (key, image) crops vertically into as few grayscale montages as fit under
+    `max_height`. Returns [(montage, [(key, top, bottom), ...]), ...].
+    """
+    groups, current, height = [], [], margin
+    for key, image in crops:
+        image = image.convert("L")
+        needed = image.height + gap
+        if current and height + needed > max_height:
+            groups.append(current)
+            current, height = [], margin
+        current.append((key, image))
+        height += needed
+    if current:
+        groups.append(current)
+
+    montages = []
+    for group in groups:
+        width = max(image.width for _, image in group) + 2 * margin
+        total = margin + sum(image.height + gap for _, image in group)
+        montage = Image.new("L", (width, total), 255)
+        slots, y = [], margin
+        for key, image in group:
+            montage.paste(image, (margin, y))
+            slots.append((key, y, y + image.height))
+            y += image.height + gap
+        montages.append((montage, slots))
+    return montages
+
+
+def assign_words(words, slots):
+    """Maps word boxes back to the crop each one sits in, keeping line breaks."""
+    texts = {key: [] for key, _, _ in slots}
+    confs = {key: [] for key, _, _ in slots}
+    last_line = {}
+    for text, left, top, right, bottom, conf, line in words:
+        center = (top + bottom) / 2
+        for key, slot_top, slot_bottom in slots:
+            if slot_top - MONTAGE_GAP / 2 <= center < slot_bottom + MONTAGE_GAP / 2:
+                parts = texts[key]
+                if parts and last_line.get(key) != line:
+                    parts.append("\n")
+                elif parts:
+                    parts.append(" ")
+                parts.append(text)
+                last_line[key] = line
+                if conf >= 0:
+                    confs[key].append(conf)
+                break
+
+    return {
+        key: ("".join(texts[key]), sum(confs[key]) / len(confs[key]) if confs[key] else 0.0)
+        for key in texts
+    }
+
+
+def ocr_crops(crops, lang="eng", config=MONTAGE_CONFIG):
+    """
+    OCRs many small (key, image) crops, from one document or many, with one
+    Tesseract pass per montage. Returns {key: (text, mean word confidence)}.
+    """
+    results = {}
+    for montage, slots in build_montages(crops):
+        words = image_to_words(montage, lang=lang, config=config)
+        results.update(assign_words(words, slots))
+    return results
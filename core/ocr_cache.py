@@ -0,0 +1,205 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+from config.constants import OCR_CACHE_FILE, OCR_CACHE_MAX_BYTES, DEFAULT_DPI
+from core.rasterize import render_page
+from core.ocr_backends import image_to_string
+
+# Cache hits only note their time in memory; last_used is written back this many hits at a time
+TOUCH_BATCH = 100
+# Other processes share the file, so the running byte total is re-read from the table this often
+RESYNC_PUTS = 200
+
+
+class OCRCache:
+    """
+    On-disk OCR result cache keyed by file content hash, page, DPI and Tesseract settings.
+    File hashes are remembered by path, size and mtime so unchanged files are never re-read.
+    The total size is tracked as entries are added, and hits update last_used in batches,
+    so neither lookups nor inserts slow down as the cache grows.
+    """
+
+    def __init__(self, path=OCR_CACHE_FILE, max_bytes=OCR_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, digest TEXT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT, size INTEGER, last_used REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_last_used ON ocr (last_used)")
+        self._conn.commit()
+        self._touched = {}
+        self._puts = 0
+        self._total = self._stored_bytes()
+
+    def _stored_bytes(self):
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr").fetchone()[0]
+
+    def file_digest(self, path):
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._lock:
+            row = self._conn.execute("SELECT size, mtime, digest FROM files WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+
+        sha = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime, digest) VALUES (?, ?, ?, ?)",
+                (path, st.st_size, st.st_mtime_ns, digest),
+            )
+            self._conn.commit()
+        return digest
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM ocr WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH:
+                self._flush_touched()
+                self._conn.commit()
+        return row[0]
+
+    def _flush_touched(self):
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE ocr SET last_used = ? WHERE key = ?", [(t, key) for key, t in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def put(self, key, text):
+        size = len(text.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM ocr WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr (key, text, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time()),
+            )
+            self._total += size - (old[0] if old else 0)
+            self._puts += 1
+            if self._puts % RESYNC_PUTS == 0:
+                self._total = self._stored_bytes()
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        if self._total <= self.max_bytes:
+            return
+        # The running total can be stale when other processes write too; recount before deleting
+        self._flush_touched()
+        total = self._total = self._stored_bytes()
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used entries until we are back under 90% of the budget
+        target = total - int(self.max_bytes * 0.9)
+        stale, freed = [], 0
+        for key, size in self._conn.execute("SELECT key, size FROM ocr ORDER BY last_used"):
+            stale.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM ocr WHERE key = ?", stale)
+        self._total -= freed
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM ocr")
+            self._conn.execute("DELETE FROM files")
+            self._conn.commit()
+            self._touched.clear()
+            self._total = 0
+
+
+class NullCache:
+    """Stand-in used when caching is switched off; every lookup misses."""
+
+    def file_digest(self, path):
+        return os.path.abspath(path)
+
+    def get(self, key):
+        return None
+
+    def put(self, key, text):
+        pass
+
+    def clear(self):
+        pass
+
+
+_cache = None
+_cache_lock = threading.Lock()
+_cache_settings = {"path": OCR_CACHE_FILE, "enabled": True}
+
+
+def configure_cache(path=OCR_CACHE_FILE, enabled=True):
+    """Points get_cache() at another file, or disables caching; call before the first OCR."""
+    global _cache
+    with _cache_lock:
+        _cache_settings.update(path=path, enabled=enabled)
+        _cache = None
+
+
+def cache_settings():
+    with _cache_lock:
+        return dict(_cache_settings)
+
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = OCRCache(_cache_settings["path"]) if _cache_settings["enabled"] else NullCache()
+        return _cache
+
+
+def make_key(*parts):
+    return hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def image_digest(image):
+    sha = hashlib.sha1(f"{image.mode}:{image.size}".encode("utf-8"))
+    sha.update(image.tobytes())
+    return sha.hexdigest()
+
+
+def page_key(path, page=1, dpi=DEFAULT_DPI, lang="eng", config=""):
+    return make_key("page", get_cache().file_digest(path), page, dpi, lang, config)
+
+
+def ocr_pdf_page(path, page=1, dpi=DEFAULT_DPI, lang="eng", config="", image=None):
+    """OCR one PDF page through the cache. Pass `image` if the page is already rendered at `dpi`."""
+    cache = get_cache()
+    key = page_key(path, page, dpi, lang, config)
+    text = cache.get(key)
+    if text is None:
+        if image is None:
+            image = render_page(path, page, dpi)
+        text = image_to_string(image, lang=lang, config=config)
+        cache.put(key, text)
+    return text
+
+
+def ocr_image(image, lang="eng", config=""):
+    cache = get_cache()
+    key = make_key("image", image_digest(image), lang, config)
+    text = cache.get(key)
+    if text is None:
+        text = image_to_string(image, lang=lang, config=config)
+        cache.put(key, text)
+    return text
@@ -0,0 +1,174 @@
+import io
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+from PIL.PngImagePlugin import PngInfo
+
+from config.constants import DEFAULT_DPI, PAGE_CACHE_DIR, PAGE_CACHE_MEMORY_BYTES, PAGE_CACHE_DISK_BYTES, PAGE_CACHE_HOT_PAGES
+from core.rasterize import render_page
+
+
+class PageImageCache:
+    """
+    LRU cache of rendered pages keyed by file identity (path, size, mtime), page and DPI.
+
+    The last few pages stay decoded ("hot"). Older pages are kept PNG-compressed in
+    memory up to a byte budget, then spilled to PNG files on disk with their own budget.
+    """
+
+    def __init__(self, memory_bytes=PAGE_CACHE_MEMORY_BYTES, disk_dir=PAGE_CACHE_DIR,
+                 disk_bytes=PAGE_CACHE_DISK_BYTES, hot_pages=PAGE_CACHE_HOT_PAGES):
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir
+        self.disk_bytes = disk_bytes
+        self.hot_pages = hot_pages
+        self._lock = threading.Lock()
+        self._hot = OrderedDict()
+        self._warm = OrderedDict()
+        self._warm_size = 0
+        self._disk = OrderedDict()
+        self._disk_size = 0
+        self._load_disk_index()
+
+    def _load_disk_index(self):
+        if not os.path.isdir(self.disk_dir):
+            return
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(".png"):
+                st = os.stat(os.path.join(self.disk_dir, name))
+                entries.append((st.st_mtime, name[:-4], st.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_size += size
+
+    @staticmethod
+    def make_key(path, page, dpi):
+        st = os.stat(path)
+        identity = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}|{page}|{dpi}"
+        return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+    def get(self, path, page=1, dpi=DEFAULT_DPI):
+        key = self.make_key(path, page, dpi)
+        with self._lock:
+            image = self._hot.get(key)
+            if image is not None:
+                self._hot.move_to_end(key)
+                return image
+            data = self._warm.pop(key, None)
+            if data is not None:
+                self._warm_size -= len(data)
+
+        if data is None:
+            data = self._read_spill(key)
+
+        if data is not None:
+            image = self._decompress(data)
+        else:
+            image = render_page(path, page, dpi)
+
+        with self._lock:
+            self._hot[key] = image
+            self._cool_down()
+        return image
+
+    def _cool_down(self):
+        while len(self._hot) > self.hot_pages:
+            key, image = self._hot.popitem(last=False)
+            if key in self._disk:
+                continue
+            data = self._compress(image)
+            self._warm[key] = data
+            self._warm_size += len(data)
+
+        while self._warm_size > self.memory_bytes and self._warm:
+            key, data = self._warm.popitem(last=False)
+            self._warm_size -= len(data)
+            self._spill(key, data)
+
+    @staticmethod
+    def _compress(image):
+        info = PngInfo()
+        info.add_text("mode", image.mode)
+        packed = image
+        colors = image.getcolors(2) if image.mode in ("L", "RGB") else None
+        if colors and all(c in (0, 255, (0, 0, 0), (255, 255, 255)) for _, c in colors):
+            # Pure black-and-white scans pack to 1 bit per pixel
+            packed = image.convert("1")
+        buf = io.BytesIO()
+        packed.save(buf, format="PNG", compress_level=3, pnginfo=info)
+        return buf.getvalue()
+
+    @staticmethod
+    def _decompress(data):
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        mode = image.info.get("mode")
+        if mode and image.mode != mode:
+            image = image.convert(mode)
+        return image
+
+    def _spill_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.png")
+
+    def _spill(self, key, data):
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            with open(self._spill_path(key), "wb") as f:
+                f.write(data)
+        except OSError:
+            return
+        self._disk[key] = len(data)
+        self._disk_size += len(data)
+        while self._disk_size > self.disk_bytes and self._disk:
+            old_key, size = self._disk.popitem(last=False)
+            self._disk_size -= size
+            try:
+                os.remove(self._spill_path(old_key))
+            except OSError:
+                pass
+
+    def _read_spill(self, key):
+        with self._lock:
+            if key not in self._disk:
+                return None
+            self._disk.move_to_end(key)
+        try:
+            with open(self._spill_path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                self._disk_size -= self._disk.pop(key, 0)
+            return None
+
+    def clear(self):
+        with self._lock:
+            self._hot.clear()
+            self._warm.clear()
+            self._warm_size = 0
+            for key in list(self._disk):
+                try:
+                    os.remove(self._spill_path(key))
+                except OSError:
+                    pass
+            self._disk.clear()
+            self._disk_size = 0
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache():
+    global _page_cache
+    with _page_cache_lock:
+        if _page_cache is None:
+            _page_cache = PageImageCache()
+        return _page_cache
+
+
+def cached_render_page(path, page=1, dpi=DEFAULT_DPI):
+    return get_page_cache().get(path, page, dpi)
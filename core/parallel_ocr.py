@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from config.constants import OCR_WORKERS, TESSERACT_THREADS, OCR_LOOKAHEAD
+from core.obr_parser import parse_obr_text, has_region_fields, has_required_fields
+from core.text_layer import page_text
+from core.form_profiles import get_profile
+from core.dpi_stats import DpiStats
+from core.ocr_cache import configure_cache, cache_settings
+
+
+def init_worker(tesseract_threads, cache):
+    # Tesseract spins up its own OpenMP threads; cap them so N processes use N cores, not N * cores.
+    # This covers spawned tesseract executables; core.ocr_backends applies the limit before it
+    # loads tesserocr, so the in-process engine is capped whether this process was forked or spawned.
+    os.environ["OMP_THREAD_LIMIT"] = str(tesseract_threads)
+    # Workers use the same OCR cache settings as the process that started them
+    configure_cache(**cache)
+
+
+def extract_obr_file(folder, filename):
+    """Returns (row, DPI tier stats) for one OBR; stats travel back from the worker process."""
+    stats = DpiStats()
+    accept = lambda text: has_required_fields(parse_obr_text(text, filename))
+    region_accept = lambda text: has_region_fields(parse_obr_text(text, filename), text)
+    text, source = page_text(
+        os.path.join(folder, filename), page=1, accept=accept, region_accept=region_accept, config="--psm 6",
+        profile=get_profile("OBR"), fields=("date", "payee", "particulars", "total"), stats=stats,
+    )
+    return parse_obr_text(text, filename) + ["", source], stats.as_dict()
+
+
+def file_cost(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def iter_extract(folder, files, workers=OCR_WORKERS, should_stop=None, task=extract_obr_file, poll_interval=0.2):
+    """
+    Runs `task(folder, filename)` for every file on a process pool and yields
+    (index, filename, result, error) in the original file order. Only files
+    within `workers * OCR_LOOKAHEAD` of the oldest unfinished one are
+    candidates, so results stream out while later files run; among those the
+    largest is dispatched first whenever a worker frees up, so one big scan
+    doesn't start last and leave the other workers idle. When `should_stop()`
+    turns true, results that already finished are still yielded.
+    """
+    if not files:
+        return
+
+    workers = max(1, min(workers, len(files)))
+    window = workers * OCR_LOOKAHEAD
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(TESSERACT_THREADS, cache_settings()))
+    pending, done_buffer, candidates = {}, {}, {}
+    next_index = next_candidate = 0
+    try:
+        while next_index < len(files):
+            if should_stop and should_stop():
+                break
+            while next_candidate < min(len(files), next_index + window):
+                candidates[next_candidate] = file_cost(os.path.join(folder, files[next_candidate]))
+                next_candidate += 1
+            # One queued task per worker beyond the running ones: enough to never idle, few enough to keep choosing
+            while candidates and len(pending) < 2 * workers:
+                i = max(candidates, key=candidates.get)
+                del candidates[i]
+                pending[executor.submit(task, folder, files[i])] = i
+
+            done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                try:
+                    done_buffer[i] = (future.result(), None)
+                except Exception as e:
+                    done_buffer[i] = (None, e)
+
+            while next_index in done_buffer:
+                result, error = done_buffer.pop(next_index)
+                yield next_index, files[next_index], result, error
+                next_index += 1
+
+        # Stopped early: hand over whatever finished out of order instead of dropping it
+        for i in sorted(done_buffer):
+            result, error = done_buffer[i]
+            yield i, files[i], result, error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
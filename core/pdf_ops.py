@@ -0,0 +1,11 @@
+from PyPDF2 import PdfMerger
+
+
+def merge_pdfs(files, output_path):
+    merger = PdfMerger()
+    try:
+        for file in files:
+            merger.append(file)
+        merger.write(output_path)
+    finally:
+        merger.close()
@@ -0,0 +1,97 @@
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Table, TableStyle
+
+from core.obr_table import AMOUNT_COLUMNS
+from core.cancellation import check_cancelled
+
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+FONT_SIZE = 7
+ROW_HEIGHT = 12
+MARGIN = 36
+# Relative column widths for the OBR columns; the table fills the page width
+COLUMN_WEIGHTS = (1.6, 1.0, 0.8, 1.6, 2.4, 1.0, 1.0, 1.0, 1.0, 1.0, 0.8)
+
+
+def fit_text(text, width, font=FONT, size=FONT_SIZE):
+    """Cuts text to fit a cell `width` points wide, ending it with an ellipsis."""
+    if stringWidth(text, font, size) <= width:
+        return text
+    # Longest prefix that still fits with the ellipsis
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if stringWidth(text[:mid] + "…", font, size) <= width:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low] + "…"
+
+
+def write_pdf_report(table, path, progress=None, should_stop=None):
+    """
+    Draws an OBRTable as a landscape register, one page at a time: every page
+    repeats the header and ends with its own subtotal row, and the last page
+    adds the grand TOTAL. Rows have a fixed height (long text is cut to the
+    cell) so pagination is known up front and only one page is laid out in
+    memory at a time.
+    """
+    progress = progress or (lambda rows_done: None)
+    page_width, page_height = landscape(letter)
+    usable = page_width - 2 * MARGIN
+    weights = COLUMN_WEIGHTS[:len(table.columns)] + (1.0,) * (len(table.columns) - len(COLUMN_WEIGHTS))
+    widths = [usable * w / sum(weights) for w in weights]
+    # Header, page subtotal and (last page) grand total rows, plus the footer line
+    rows_per_page = max(1, int((page_height - 2 * MARGIN - ROW_HEIGHT) // ROW_HEIGHT) - 3)
+    pages = max(1, -(-len(table) // rows_per_page))
+
+    style = TableStyle([
+        ("FONTNAME", (0, 0), (-1, -1), FONT),
+        ("FONTSIZE", (0, 0), (-1, -1), FONT_SIZE),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("FONTNAME", (0, 0), (-1, 0), BOLD_FONT),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("TOPPADDING", (0, 0), (-1, -1), 1),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 1),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+    ])
+    header = [fit_text(name, w - 4, BOLD_FONT) for name, w in zip(table.columns, widths)]
+
+    canvas = Canvas(path, pagesize=(page_width, page_height))
+    for page in range(pages):
+        check_cancelled(should_stop)
+        first = page * rows_per_page
+        last = min(len(table), first + rows_per_page)
+        progress(first)
+
+        data = [header]
+        for row in range(first, last):
+            data.append([fit_text(table.text(row, col), w - 4) for col, w in enumerate(widths)])
+        subtotal = ["Page subtotal"] + [""] * (len(table.columns) - 1)
+        for col in AMOUNT_COLUMNS:
+            subtotal[col] = f"{sum(table.amount(row, col) for row in range(first, last)):,.2f}"
+        data.append(subtotal)
+        summary_rows = [len(data) - 1]
+        if page == pages - 1:
+            data.append(table.totals_texts())
+            summary_rows.append(len(data) - 1)
+
+        page_style = TableStyle(style.getCommands())
+        for i in summary_rows:
+            page_style.add("FONTNAME", (0, i), (-1, i), BOLD_FONT)
+            page_style.add("BACKGROUND", (0, i), (-1, i), colors.lightgrey)
+
+        grid = Table(data, colWidths=widths, rowHeights=ROW_HEIGHT)
+        grid.setStyle(page_style)
+        _, height = grid.wrapOn(canvas, usable, page_height)
+        grid.drawOn(canvas, MARGIN, page_height - MARGIN - height)
+
+        canvas.setFont(FONT, FONT_SIZE)
+        canvas.drawRightString(page_width - MARGIN, MARGIN / 2, f"Page {page + 1} of {pages}")
+        canvas.showPage()
+    canvas.save()
@@ -0,0 +1,326 @@
+import os
+import queue
+import itertools
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from config.constants import (
+    OCR_WORKERS, TESSERACT_THREADS, FULL_PAGE_DPI_TIERS, PIPELINE_RENDER_THREADS, PIPELINE_QUEUE_SIZE,
+)
+from core.parallel_ocr import init_worker, file_cost
+from core.ocr_cache import get_cache, cache_settings, page_key
+from core.ocr_backends import image_to_string
+from core.rasterize import render_page
+from core.text_layer import read_text_layer, SOURCE_TEXT_LAYER, SOURCE_REGIONS, SOURCE_OCR
+from core.form_profiles import get_profile, prepare_field_crops, ocr_field_crops
+from core.obr_parser import parse_obr_text, has_region_fields, has_required_fields
+from core.dpi_stats import DpiStats
+
+OBR_FIELDS = ("date", "payee", "particulars", "total")
+PAGE_CONFIG = "--psm 6"
+STAGES = ("render", "ocr", "parse")
+# FolderManifest job name for extracted OBR rows
+EXTRACT_JOB = "extract"
+
+
+def ocr_page_task(image, lang, config, key):
+    text = image_to_string(image, lang=lang, config=config)
+    get_cache().put(key, text)
+    return text
+
+
+class _Job:
+    def __init__(self, index, folder, filename):
+        self.index = index
+        self.filename = filename
+        self.path = os.path.join(folder, filename)
+        self.attempt = 0
+        self.texts = {}
+        self.remaining = list(OBR_FIELDS)
+        self.text = ""
+        self.stats = DpiStats()
+        # Filled by the render stage for the OCR / parse stages
+        self.kind = None
+        self.dpi = None
+        self.cached = {}
+        self.result = None
+        self.error = None
+
+
+class ExtractPipeline:
+    """
+    OBR extraction as three stages with their own concurrency:
+
+        render (threads: text layer, cache lookups, poppler)
+          -> bounded queue ->
+        OCR (process pool)
+          -> parse (the iterating thread: regex parsing, DPI escalation)
+
+    so rendering the next files overlaps with OCR of the current ones. A file
+    whose read doesn't parse goes back to the render stage at the next DPI tier
+    (region tiers first, then whole-page tiers) ahead of new files. Iterating
+    yields (index, filename, (row, stats), error) in file order, like
+    iter_extract: files enter in that order and a file's in-flight slot is only
+    freed once it has been yielded, which bounds how far ahead of the oldest
+    unfinished file the stages run.
+    """
+
+    def __init__(self, folder, files, workers=OCR_WORKERS, render_threads=PIPELINE_RENDER_THREADS,
+                 queue_size=PIPELINE_QUEUE_SIZE, should_stop=None, poll_interval=0.2):
+        self.folder = folder
+        self.files = files
+        self.workers = max(1, min(workers, len(files) or 1))
+        self.render_threads = render_threads
+        self.queue_size = queue_size
+        self.should_stop = should_stop
+        self.poll_interval = poll_interval
+        self.profile = get_profile("OBR")
+        self.attempts = (
+            [("text", None)]
+            + [("regions", dpi) for dpi in self.profile.dpi_tiers]
+            + [("page", dpi) for dpi in FULL_PAGE_DPI_TIERS]
+        )
+
+        # Retries (priority 0) jump ahead of new files (priority 1); the number of
+        # files fed but not yet yielded is capped, so this queue stays bounded in practice.
+        self._render_queue = queue.PriorityQueue()
+        self._ocr_queue = queue.Queue(maxsize=queue_size)
+        self._parse_queue = queue.Queue()
+        self._in_flight = threading.Semaphore(2 * queue_size + self.workers)
+        self._ocr_slots = threading.Semaphore(2 * self.workers)
+        self._ocr_running = 0
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._stop = threading.Event()
+        self._depth_totals = Counter()
+        self._depth_samples = 0
+
+    def depths(self):
+        with self._lock:
+            running = self._ocr_running
+        return {
+            "render": self._render_queue.qsize(),
+            "ocr": self._ocr_queue.qsize() + running,
+            "parse": self._parse_queue.qsize(),
+        }
+
+    def depth_text(self):
+        return ", ".join(f"{stage} {n}" for stage, n in self.depths().items())
+
+    def depth_summary(self):
+        """Mean queue depth per stage over the run; the deepest stage is the bottleneck."""
+        if not self._depth_samples:
+            return "no samples"
+        return ", ".join(f"{stage} {self._depth_totals[stage] / self._depth_samples:.1f}" for stage in STAGES)
+
+    def _sample_depths(self):
+        self._depth_totals.update(self.depths())
+        self._depth_samples += 1
+
+    def _stopping(self):
+        return self._stop.is_set() or bool(self.should_stop and self.should_stop())
+
+    def _feed(self):
+        for i in range(len(self.files)):
+            while not self._in_flight.acquire(timeout=self.poll_interval):
+                if self._stopping():
+                    return
+            if self._stopping():
+                return
+            # Among new files waiting for a render thread the largest goes first, to balance the OCR pool
+            cost = file_cost(os.path.join(self.folder, self.files[i]))
+            self._render_queue.put((1, -cost, next(self._seq), _Job(i, self.folder, self.files[i])))
+
+    def _render(self):
+        while not self._stop.is_set():
+            try:
+                job = self._render_queue.get(timeout=self.poll_interval)[-1]
+            except queue.Empty:
+                continue
+            try:
+                self._render_job(job)
+            except Exception as e:
+                self._retry(job, e)
+
+    def _retry(self, job, error):
+        """
+        Like page_text, a stage that fails outright (PyPDF2 can't size the page, a
+        crop won't render, OCR crashes) falls through to the next one: failed
+        region reads go straight to whole-page OCR. Only once no attempt is left
+        does the file fail with `error`.
+        """
+        kind = self.attempts[job.attempt][0]
+        later = [
+            i for i in range(job.attempt + 1, len(self.attempts))
+            if kind == "page" or self.attempts[i][0] != kind
+        ]
+        if later:
+            job.attempt = later[0]
+            self._render_queue.put((0, 0, next(self._seq), job))
+        else:
+            job.error = error
+            self._parse_queue.put(job)
+
+    def _render_job(self, job):
+        job.kind, job.dpi = self.attempts[job.attempt]
+        job.result = None
+        if job.kind == "text":
+            try:
+                job.result = read_text_layer(job.path, 1)
+            except Exception:
+                job.result = ""
+            self._parse_queue.put(job)
+
+        elif job.kind == "regions":
+            job.cached, crops, keys = prepare_field_crops(job.index, job.path, self.profile, job.remaining, job.dpi)
+            if crops:
+                self._put_ocr(job, (ocr_field_crops, crops, keys))
+            else:
+                job.result = {}
+                self._parse_queue.put(job)
+
+        else:
+            key = page_key(job.path, 1, job.dpi, self.profile.lang, PAGE_CONFIG)
+            job.result = get_cache().get(key)
+            if job.result is not None:
+                self._parse_queue.put(job)
+            else:
+                # Tesseract works on grayscale anyway; a third of the bytes to ship to the worker
+                image = render_page(job.path, 1, job.dpi).convert("L")
+                self._put_ocr(job, (ocr_page_task, image, self.profile.lang, PAGE_CONFIG, key))
+
+    def _put_ocr(self, job, task):
+        # Blocks while the OCR stage is behind: this is the render stage's back-pressure
+        while not self._stop.is_set():
+            try:
+                self._ocr_queue.put((job, task), timeout=self.poll_interval)
+                return
+            except queue.Full:
+                continue
+
+    def _dispatch(self, executor):
+        while not self._stop.is_set():
+            try:
+                job, task = self._ocr_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+            while not self._ocr_slots.acquire(timeout=self.poll_interval):
+                if self._stop.is_set():
+                    return
+            with self._lock:
+                self._ocr_running += 1
+            try:
+                future = executor.submit(*task)
+            except RuntimeError:
+                return
+            future.add_done_callback(lambda f, job=job: self._ocr_done(job, f))
+
+    def _ocr_done(self, job, future):
+        with self._lock:
+            self._ocr_running -= 1
+        self._ocr_slots.release()
+        if future.cancelled():
+            return
+        try:
+            job.result = future.result()
+        except Exception as e:
+            self._retry(job, e)
+            return
+        self._parse_queue.put(job)
+
+    def _parse(self, job):
+        """Returns the finished (row, stats) or None after sending the job back for another tier."""
+        accept = lambda text: has_required_fields(parse_obr_text(text, job.filename))
+        region_accept = lambda text: has_region_fields(parse_obr_text(text, job.filename, job.texts.get("total", "")), text)
+
+        if job.kind == "text":
+            job.text = job.result
+            if job.text.strip() and accept(job.text):
+                return self._finish(job, SOURCE_TEXT_LAYER)
+
+        elif job.kind == "regions":
+            results = dict(job.cached)
+            results.update({f: result for (_, f), result in job.result.items()})
+            failed = []
+            for f in job.remaining:
+                text, conf = results[f]
+                job.texts[f] = text
+                if not self.profile.field_ok(f, text, conf):
+                    failed.append(f)
+            job.text = "\n".join(job.texts.get(f, "") for f in OBR_FIELDS)
+            if not failed and region_accept(job.text):
+                job.stats.record("regions", job.dpi)
+                return self._finish(job, SOURCE_REGIONS)
+            job.remaining = failed or list(OBR_FIELDS)
+            if self.attempts[job.attempt + 1][0] != "regions":
+                job.stats.record_failure("regions")
+
+        else:
+            job.text = job.result
+            if accept(job.text):
+                job.stats.record("page", job.dpi)
+                return self._finish(job, SOURCE_OCR)
+            if job.attempt + 1 == len(self.attempts):
+                job.stats.record_failure("page")
+                return self._finish(job, SOURCE_OCR)
+
+        job.attempt += 1
+        self._render_queue.put((0, 0, next(self._seq), job))
+        return None
+
+    def _finish(self, job, source):
+        total_text = job.texts.get("total", "") if source == SOURCE_REGIONS else None
+        return parse_obr_text(job.text, job.filename, total_text) + ["", source], job.stats.as_dict()
+
+    def __iter__(self):
+        if not self.files:
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(TESSERACT_THREADS, cache_settings())
+        )
+        threads = [threading.Thread(target=self._feed, daemon=True)]
+        threads += [threading.Thread(target=self._render, daemon=True) for _ in range(self.render_threads)]
+        threads.append(threading.Thread(target=self._dispatch, args=(executor,), daemon=True))
+        for thread in threads:
+            thread.start()
+
+        done_buffer = {}
+        next_index = 0
+        try:
+            while next_index < len(self.files):
+                if self.should_stop and self.should_stop():
+                    break
+                try:
+                    job = self._parse_queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+                self._sample_depths()
+
+                if job.error is not None:
+                    done_buffer[job.index] = (None, job.error)
+                else:
+                    try:
+                        result = self._parse(job)
+                    except Exception as e:
+                        result, job.error = None, e
+                        done_buffer[job.index] = (None, e)
+                    if result is not None:
+                        done_buffer[job.index] = (result, None)
+
+                while next_index in done_buffer:
+                    result, error = done_buffer.pop(next_index)
+                    self._in_flight.release()
+                    yield next_index, self.files[next_index], result, error
+                    next_index += 1
+
+            # Stopped early: hand over whatever finished out of order instead of dropping it
+            for i in sorted(done_buffer):
+                result, error = done_buffer[i]
+                yield i, self.files[i], result, error
+        finally:
+            self._stop.set()
+            # After a complete run nothing is left running, so joining the workers is free
+            # and keeps the pool from being torn down at interpreter exit
+            executor.shutdown(wait=next_index >= len(self.files), cancel_futures=True)
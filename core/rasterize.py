@@ -0,0 +1,58 @@
+import io
+import os
+import subprocess
+
+from PIL import Image
+from PyPDF2 import PdfReader
+from pdf2image import convert_from_path
+
+from config.constants import DEFAULT_DPI
+
+
+def render_page(path, page=1, dpi=DEFAULT_DPI):
+    return convert_from_path(path, dpi=dpi, first_page=page, last_page=page)[0]
+
+
+def page_size_points(path, page=1):
+    pdf_page = PdfReader(path).pages[page - 1]
+    width, height = float(pdf_page.mediabox.width), float(pdf_page.mediabox.height)
+    if (pdf_page.get("/Rotate") or 0) % 180:
+        width, height = height, width
+    return width, height
+
+
+def region_to_pixels(box, size_points, dpi):
+    left, top, right, bottom = box
+    width_px = size_points[0] * dpi / 72.0
+    height_px = size_points[1] * dpi / 72.0
+    x, y = int(left * width_px), int(top * height_px)
+    return x, y, max(1, int(right * width_px) - x), max(1, int(bottom * height_px) - y)
+
+
+def render_region(path, page, box, dpi=DEFAULT_DPI, size_points=None):
+    """
+    Renders only `box` (left, top, right, bottom as page fractions) of one page,
+    in grayscale, by asking pdftoppm to crop before rasterizing.
+    """
+    if size_points is None:
+        size_points = page_size_points(path, page)
+    x, y, w, h = region_to_pixels(box, size_points, dpi)
+
+    cmd = [
+        "pdftoppm", "-f", str(page), "-l", str(page), "-r", str(dpi),
+        "-x", str(x), "-y", str(y), "-W", str(w), "-H", str(h),
+        "-gray", "-singlefile", path,
+    ]
+    startupinfo = None
+    if os.name == "nt":
+        # Keep a console window from flashing up for every region
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    out = subprocess.run(cmd, capture_output=True, check=True, startupinfo=startupinfo).stdout
+    return Image.open(io.BytesIO(out)).copy()
+
+
+def crop_fraction(image, box):
+    width, height = image.size
+    left, top, right, bottom = box
+    return image.crop((int(left * width), int(top * height), int(right * width), int(bottom * height)))
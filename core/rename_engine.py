@@ -0,0 +1,199 @@
+import os
+import re
+from functools import partial
+
+from config.constants import OCR_WORKERS
+
+from core.text_layer import page_text, read_text_layer, SOURCE_TEXT_LAYER, SOURCE_ANCHOR
+from core.form_profiles import get_profile
+from core.anchor_ocr import anchor_text
+from core.page_cache import cached_render_page
+from core.dpi_stats import DpiStats
+from core.parallel_ocr import iter_extract
+from core.cancellation import OperationCancelled
+from core.rename_parsers import (
+    parse_obr_serial, parse_saro_guesses, confident_saro_number, parse_nca_number, parse_nca_line, NCA_ANCHOR,
+    OBR_SERIAL_PATTERN, SARO_NUMBER_PATTERN,
+)
+
+
+class RenameCandidate:
+    """What the automatic pass found for one file; unconfident ones go to the review queue."""
+
+    def __init__(self, path, mode, suggestions, confident, source=""):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.mode = mode
+        self.suggestions = suggestions
+        self.confident = confident
+        self.source = source
+
+    @property
+    def suggestion(self):
+        return self.suggestions[0] if self.suggestions else ""
+
+    def as_dict(self):
+        return {"suggestions": self.suggestions, "confident": self.confident, "source": self.source}
+
+    @classmethod
+    def from_dict(cls, path, mode, data):
+        return cls(path, mode, data["suggestions"], data["confident"], data.get("source", ""))
+
+
+def analyze_obr(path, stats=None, should_stop=None):
+    text, source = page_text(
+        path, accept=lambda t: parse_obr_serial(t) is not None,
+        profile=get_profile("OBR"), fields=("serial",), stats=stats, should_stop=should_stop,
+    )
+    serial = parse_obr_serial(text)
+    return RenameCandidate(path, "OBR", [serial] if serial else [], serial is not None, source)
+
+
+def analyze_saro(path, stats=None, should_stop=None):
+    # No pre-rendered page: the text layer, region crops and DPI tiers all come first.
+    # Queued candidates get their full-page render in prepare_preview.
+    profile = get_profile("SARO")
+    text, source = page_text(
+        path, accept=lambda t: bool(parse_saro_guesses(t)), profile=profile, config=profile.config,
+        stats=stats, should_stop=should_stop,
+    )
+    guesses = parse_saro_guesses(text)
+    confident = confident_saro_number(guesses)
+    if confident:
+        guesses = [confident] + [g for g in guesses if g != confident]
+    return RenameCandidate(path, "SARO", guesses, confident is not None, source)
+
+
+def analyze_nca(path, stats=None, should_stop=None):
+    profile = get_profile("NCA")
+    try:
+        number, source = parse_nca_number(read_text_layer(path, profile.page)), SOURCE_TEXT_LAYER
+    except Exception:
+        number = None
+
+    if number is None:
+        try:
+            number, source = anchor_text(path, profile, "number", NCA_ANCHOR, parse_nca_line, stats, should_stop), SOURCE_ANCHOR
+        except OperationCancelled:
+            raise
+        except Exception:
+            # A page the anchor stage can't render still gets the whole-page read
+            number = None
+            if stats is not None:
+                stats.record_failure("anchor")
+
+    if number is None:
+        # Anchor never found: last resort is the whole page
+        text, source = page_text(
+            path, accept=lambda t: parse_nca_number(t) is not None, config="--psm 6",
+            stats=stats, should_stop=should_stop,
+        )
+        number = parse_nca_number(text)
+
+    return RenameCandidate(path, "NCA", [number] if number else [], number is not None, source)
+
+
+ANALYZERS = {
+    "OBR": analyze_obr,
+    "NCA": analyze_nca,
+    "SARO": analyze_saro,
+}
+
+# Modes analyzed on the process pool; NCA folders are the largest batches
+PARALLEL_MODES = ("NCA",)
+
+
+def analyze_file(mode, path, stats=None, should_stop=None):
+    return ANALYZERS[mode](path, stats, should_stop)
+
+
+def analyze_folder_file(mode, folder, filename):
+    """Process-pool task: returns (candidate, DPI tier stats) for one file."""
+    stats = DpiStats()
+    candidate = analyze_file(mode, os.path.join(folder, filename), stats)
+    return candidate, stats.as_dict()
+
+
+def iter_analyze(mode, folder, files, workers=OCR_WORKERS, stats=None, should_stop=None):
+    """
+    Analyzes `files` (on the process pool for PARALLEL_MODES) and yields
+    (index, filename, candidate, error) in folder order until `should_stop()`.
+    """
+    if mode in PARALLEL_MODES:
+        task = partial(analyze_folder_file, mode)
+        for i, file, result, error in iter_extract(folder, files, workers, should_stop, task):
+            if error is not None:
+                yield i, file, None, error
+                continue
+            candidate, file_stats = result
+            if stats is not None:
+                stats.merge(file_stats)
+            yield i, file, candidate, None
+        return
+
+    for i, file in enumerate(files):
+        if should_stop and should_stop():
+            break
+        try:
+            candidate = analyze_file(mode, os.path.join(folder, file), stats, should_stop)
+        except OperationCancelled:
+            break
+        except Exception as e:
+            yield i, file, None, e
+            continue
+        yield i, file, candidate, None
+
+
+def rename_job(mode):
+    """Name of the folder manifest job that remembers this mode's candidates."""
+    return f"rename-{mode}"
+
+
+def already_named(mode, filename):
+    """True if the file name is already a well-formed number for this mode."""
+    stem = os.path.splitext(filename)[0]
+    if mode == "OBR":
+        return re.fullmatch(OBR_SERIAL_PATTERN, stem) is not None
+    if mode == "NCA":
+        return parse_nca_line(stem) == stem
+    if mode == "SARO":
+        return re.match(SARO_NUMBER_PATTERN, stem) is not None
+    return False
+
+
+def prepare_preview(candidate):
+    # Render now so the review screen opens instantly from the page cache
+    cached_render_page(candidate.path)
+
+
+def normalize_name(mode, name):
+    name = name.strip()
+    if name.lower().endswith(".pdf"):
+        name = name[:-4]
+    if mode == "SARO" and name and not name.upper().startswith(("SARO-", "A-")):
+        name = "A-" + name
+    return name
+
+
+def apply_rename(candidate, name):
+    """Returns (True, new file name) or (False, reason)."""
+    name = normalize_name(candidate.mode, name or "")
+    if not name:
+        return False, f"{candidate.filename} (manual input blank)"
+
+    new_name = f"{name}.pdf"
+    new_path = os.path.join(os.path.dirname(candidate.path), new_name)
+    if os.path.abspath(new_path) == os.path.abspath(candidate.path):
+        return True, new_name
+    if os.path.exists(new_path):
+        return False, f"{candidate.filename} (already exists as {new_name})"
+    os.rename(candidate.path, new_path)
+    return True, new_name
+
+
+def auto_rename(candidate):
+    """Applies a confident candidate's suggestion; returns (renamed, message)."""
+    ok, result = apply_rename(candidate, candidate.suggestion)
+    if ok:
+        return True, f"{candidate.filename} ➔ {result} ({candidate.source})"
+    return False, result
@@ -0,0 +1,83 @@
+import re
+
+OBR_SERIAL_PATTERN = r"(CA\-MOOE\S+|MOOE\S+|PGF\S+|PS\S+)"
+# The NCA number is printed on the line just above this one
+NCA_ANCHOR = "2067"
+SARO_NUMBER_PATTERN = r"^(SARO-[A-Z]{3}-[A-Z]?-?\d{2}-\d{7}|[A-Z]{1,4}-\d{2}-\d{5,7})$"
+
+
+def parse_obr_serial(text):
+    match = re.search(OBR_SERIAL_PATTERN, text)
+    return match.group(1).strip() if match else None
+
+
+def parse_saro_guesses(text):
+    auto_guess = None
+    match = re.search(r"SARO\s*No\.?.?[:\-~]?\s*([A-Z0-9\-~]+)", text, re.IGNORECASE)
+    if match:
+        auto_guess = match.group(1).replace("~", "-").replace("–", "-").strip()
+        if not auto_guess.upper().startswith(("SARO-", "A-")):
+            auto_guess = "A-" + auto_guess
+
+    guesses = []
+    if auto_guess:
+        guesses.append(auto_guess)
+
+    for line in text.splitlines():
+        cleaned = line.strip().replace("~", "-").replace("–", "-")
+        if re.match(SARO_NUMBER_PATTERN, cleaned):
+            if cleaned not in guesses:
+                guesses.append(cleaned)
+
+    return list(dict.fromkeys(guesses))[:3]
+
+
+def confident_saro_number(guesses):
+    # Only trust a SARO number when exactly one well-formed candidate was read
+    valid = [g for g in guesses if re.match(SARO_NUMBER_PATTERN, g)]
+    return valid[0] if len(set(valid)) == 1 else None
+
+
+def parse_saro_number(text):
+    patterns = [
+        r"(SARO[-\s]?[A-Z]{3}[-\s]?[A-Z]?[-\s]?\d{2}[-\s]?\d{7})",  # e.g. SARO-BMB-A-08-0016104
+        r"\b([A-Z]{1}-\d{2}-\d{5})\b"  # e.g. A-01-05818
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            return match.group(1).replace(" ", "").strip()
+    return None
+
+
+def parse_nca_line(line):
+    # Priority: 7-digit NCA format
+    match = re.search(r"(NCA-[A-Z]{2,5}-[A-Z]-\d{2,4}-\d{7})", line)
+    if match:
+        return match.group(1).strip()
+
+    # Fallback: 6-digit variant
+    match = re.search(r"(NCA-[A-Z]{2,5}-[A-Z]-\d{2,4}-\d{6})", line)
+    if match:
+        return match.group(1).strip()
+
+    # Fallback: plain numeric code like '345247-0'
+    match = re.search(r"(\d{5,7}[-–]\d{1,3})", line)
+    if match:
+        return match.group(1).strip()
+
+    return None
+
+
+def parse_nca_number(text):
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+
+    for i, line in enumerate(lines):
+        if NCA_ANCHOR in line:
+            if i > 0:
+                number = parse_nca_line(lines[i - 1])
+                if number:
+                    return number
+
+    return None
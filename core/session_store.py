@@ -0,0 +1,120 @@
+import json
+import sqlite3
+import threading
+from array import array
+
+from core.obr_table import OBRTable
+
+JOURNAL_CELL = "cell"
+JOURNAL_ORDER = "order"
+
+
+class SessionStore:
+    """
+    SQLite copy of the OBR table so a closed or crashed window doesn't mean
+    running OCR again. Extracted rows are appended as they arrive; later cell
+    edits and sorts go to an append-only journal that restore() replays over
+    the rows. compact() folds the journal back into the rows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rows (id INTEGER PRIMARY KEY, data TEXT)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS journal "
+            "(seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT, row INTEGER, col INTEGER, text TEXT, data BLOB)"
+        )
+        self._conn.commit()
+        self._journal_size = self._conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+        self.closed = False
+
+    def start(self, folder, columns):
+        """Begins a new session for `folder`, dropping the previous one."""
+        with self._lock:
+            self._conn.execute("DELETE FROM rows")
+            self._conn.execute("DELETE FROM journal")
+            self._conn.execute("DELETE FROM meta")
+            self._conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("folder", folder), ("columns", json.dumps(list(columns)))],
+            )
+            self._conn.commit()
+            self._journal_size = 0
+
+    def append_rows(self, rows):
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO rows (data) VALUES (?)", [(json.dumps(row, ensure_ascii=False),) for row in rows]
+            )
+            self._conn.commit()
+
+    def journal_cells(self, cells):
+        """Records (row, col, text) cell writes, in the order they were made."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO journal (kind, row, col, text) VALUES (?, ?, ?, ?)",
+                [(JOURNAL_CELL, row, col, text) for row, col, text in cells],
+            )
+            self._conn.commit()
+            self._journal_size += len(cells)
+
+    def journal_order(self, order):
+        """Records a sort that put old row order[i] at row i."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO journal (kind, data) VALUES (?, ?)", (JOURNAL_ORDER, array("l", order).tobytes())
+            )
+            self._conn.commit()
+            self._journal_size += 1
+
+    def info(self):
+        """{"folder", "rows", "edits"} for the stored session, or None if there is none."""
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            rows = self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+            edits = self._conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+        if not rows:
+            return None
+        return {"folder": meta.get("folder", ""), "rows": rows, "edits": edits}
+
+    def restore(self):
+        """(folder, OBRTable) with the journal replayed over the stored rows."""
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            table = OBRTable(json.loads(meta["columns"])) if "columns" in meta else OBRTable()
+            table.append_rows([json.loads(data) for data, in self._conn.execute("SELECT data FROM rows ORDER BY id")])
+            journal = self._conn.execute("SELECT kind, row, col, text, data FROM journal ORDER BY seq")
+            for kind, row, col, text, data in journal:
+                if kind == JOURNAL_CELL:
+                    table.set_text(row, col, text)
+                elif kind == JOURNAL_ORDER:
+                    order = array("l")
+                    order.frombytes(data)
+                    # Rows extracted after the sort were appended below the sorted ones
+                    order.extend(range(len(order), len(table)))
+                    table.reorder(order)
+        return meta.get("folder", ""), table
+
+    def compact(self, table):
+        """Rewrites the stored rows from `table` and empties the journal."""
+        with self._lock:
+            self._conn.execute("DELETE FROM rows")
+            self._conn.execute("DELETE FROM journal")
+            self._conn.executemany(
+                "INSERT INTO rows (data) VALUES (?)", [(json.dumps(row, ensure_ascii=False),) for row in table.rows()]
+            )
+            self._conn.commit()
+            self._journal_size = 0
+
+    def journal_size(self):
+        """Journal entries recorded since the rows were last written."""
+        return self._journal_size
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+            self.closed = True
@@ -0,0 +1,213 @@
+import os
+import re
+import mmap
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from PyPDF2 import PdfReader, PdfWriter
+
+from config.constants import SPLIT_WORKERS, SPLIT_PARALLEL_MIN_PAGES
+from utils.helpers import sanitize_filename
+
+# pages: one file per page; ranges: "1-3, 5, 8-"; chunks: every N pages; bookmarks: one file per top-level bookmark
+SPLIT_MODES = ("pages", "ranges", "chunks", "bookmarks")
+RANGE_PATTERN = re.compile(r"^\s*(\d*)\s*(?:(-)\s*(\d*))?\s*$")
+# Open readers kept per process; a folder batch moves through its files in order
+READER_CACHE_SIZE = 4
+# Output files are handed to the pool in groups of about this many pages to keep IPC overhead down
+TASK_PAGES = 25
+
+_readers = OrderedDict()
+
+
+def open_reader(path):
+    """PdfReader over a read-only memory map of `path`, kept open for reuse in this process."""
+    entry = _readers.get(path)
+    if entry is not None:
+        _readers.move_to_end(path)
+        return entry[2]
+
+    f = open(path, "rb")
+    try:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        f.close()
+        raise
+    _readers[path] = (f, data, PdfReader(data))
+    while len(_readers) > READER_CACHE_SIZE:
+        _close(_readers.popitem(last=False)[1])
+    return _readers[path][2]
+
+
+def close_readers():
+    while _readers:
+        _close(_readers.popitem()[1])
+
+
+def _close(entry):
+    f, data, _ = entry
+    data.close()
+    f.close()
+
+
+def parse_page_ranges(text, page_count):
+    """[(first, last), ...] 1-based and inclusive from text like "1-3, 5, 8-"; open ends run to the first/last page."""
+    ranges = []
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        match = RANGE_PATTERN.match(part)
+        if not match or not (match.group(1) or match.group(3)):
+            raise ValueError(f"Bad page range: '{part.strip()}'")
+        first = int(match.group(1)) if match.group(1) else 1
+        last = (int(match.group(3)) if match.group(3) else page_count) if match.group(2) else first
+        if not 1 <= first <= last <= page_count:
+            raise ValueError(f"Page range '{part.strip()}' is outside pages 1-{page_count}")
+        ranges.append((first, last))
+    if not ranges:
+        raise ValueError("No page ranges given")
+    return ranges
+
+
+def _span_name(first, last):
+    return f"page_{first}.pdf" if first == last else f"pages_{first}-{last}.pdf"
+
+
+def _bookmark_parts(reader, page_count):
+    starts = []
+    for item in reader.outline:
+        # Nested lists are the children of the previous bookmark; only top-level entries split
+        if isinstance(item, list):
+            continue
+        page = reader.get_destination_page_number(item)
+        if page is not None and page >= 0 and all(page != start for start, _ in starts):
+            starts.append((page, item.title))
+    if not starts:
+        raise ValueError("The PDF has no bookmarks")
+    starts.sort(key=lambda start: start[0])
+    if starts[0][0] > 0:
+        starts.insert(0, (0, "Front matter"))
+
+    parts = []
+    for i, (start, title) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else page_count
+        name = f"{i + 1:02d}_{sanitize_filename(title or '') or 'section'}.pdf"
+        parts.append((name, list(range(start, end))))
+    return parts
+
+
+def plan_split(input_pdf, mode="pages", ranges="", chunk_size=1):
+    """[(output file name, [0-based page numbers]), ...] for one PDF."""
+    reader = open_reader(input_pdf)
+    page_count = len(reader.pages)
+    if mode == "pages":
+        spans = [(page, page) for page in range(1, page_count + 1)]
+    elif mode == "ranges":
+        spans = parse_page_ranges(ranges, page_count)
+    elif mode == "chunks":
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1 page")
+        spans = [(page, min(page + chunk_size - 1, page_count)) for page in range(1, page_count + 1, chunk_size)]
+    elif mode == "bookmarks":
+        return _bookmark_parts(reader, page_count)
+    else:
+        raise ValueError(f"Unknown split mode: {mode}")
+    return [(_span_name(first, last), list(range(first - 1, last))) for first, last in spans]
+
+
+def write_part(input_pdf, pages, output_path):
+    """Writes the given pages of `input_pdf` to `output_path`."""
+    reader = open_reader(input_pdf)
+    writer = PdfWriter()
+    for page in pages:
+        writer.add_page(reader.pages[page])
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return output_path
+
+
+def write_parts(jobs):
+    """Process-pool task: writes (input, pages, output path) jobs, returning [(output path, error), ...]."""
+    results = []
+    for input_pdf, pages, output_path in jobs:
+        try:
+            write_part(input_pdf, pages, output_path)
+            results.append((output_path, None))
+        except Exception as e:
+            results.append((output_path, e))
+    return results
+
+
+def _group_jobs(jobs):
+    group, pages = [], 0
+    for job in jobs:
+        group.append(job)
+        pages += len(job[1])
+        if pages >= TASK_PAGES:
+            yield group
+            group, pages = [], 0
+    if group:
+        yield group
+
+
+def iter_split(inputs, output_folder, mode="pages", ranges="", chunk_size=1, workers=SPLIT_WORKERS,
+               should_stop=None, poll_interval=0.2):
+    """
+    Splits every PDF in `inputs` by `mode` into `output_folder` (one subfolder
+    per PDF when there are several) and yields (done, total, path, error) as
+    each output file is written. A PDF that can't be split the requested way
+    is reported once, with its own path. Large jobs are written on a process
+    pool; every worker reads each input through its own memory map, so the
+    pages are shared through the OS page cache rather than copied.
+    """
+    jobs, failed = [], []
+    for input_pdf in inputs:
+        folder = output_folder
+        if len(inputs) > 1:
+            folder = os.path.join(output_folder, os.path.splitext(os.path.basename(input_pdf))[0])
+        try:
+            parts = plan_split(input_pdf, mode, ranges, chunk_size)
+            os.makedirs(folder, exist_ok=True)
+        except Exception as e:
+            failed.append((input_pdf, e))
+            continue
+        jobs += [(input_pdf, pages, os.path.join(folder, name)) for name, pages in parts]
+    close_readers()
+
+    total, done = len(jobs) + len(failed), 0
+    for input_pdf, error in failed:
+        done += 1
+        yield done, total, input_pdf, error
+
+    if workers <= 1 or sum(len(pages) for _, pages, _ in jobs) < SPLIT_PARALLEL_MIN_PAGES:
+        try:
+            for input_pdf, pages, output_path in jobs:
+                if should_stop and should_stop():
+                    break
+                try:
+                    write_part(input_pdf, pages, output_path)
+                    error = None
+                except Exception as e:
+                    error = e
+                done += 1
+                yield done, total, output_path, error
+        finally:
+            close_readers()
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+    try:
+        pending = {executor.submit(write_parts, group): group for group in _group_jobs(jobs)}
+        while pending:
+            if should_stop and should_stop():
+                break
+            finished, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in finished:
+                group = pending.pop(future)
+                error = future.exception()
+                results = future.result() if error is None else [(output_path, error) for _, _, output_path in group]
+                for output_path, part_error in results:
+                    done += 1
+                    yield done, total, output_path, part_error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
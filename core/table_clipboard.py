@@ -0,0 +1,35 @@
+import io
+import csv
+import html
+
+
+def write_selection(rows, tsv_out, html_out):
+    """
+    Streams rows of cell text to TSV (quoted the way Excel pastes it) and to an
+    HTML table, so spreadsheets keep the cell layout either way.
+    """
+    writer = csv.writer(tsv_out, dialect="excel-tab", lineterminator="\n")
+    html_out.write("<table>\n")
+    for row in rows:
+        writer.writerow(row)
+        html_out.write("<tr>")
+        for text in row:
+            html_out.write("<td>")
+            html_out.write(html.escape(text).replace("\n", "<br>"))
+            html_out.write("</td>")
+        html_out.write("</tr>\n")
+    html_out.write("</table>\n")
+
+
+def selection_text(rows):
+    """(tsv, html) for rows of cell text."""
+    tsv, markup = io.StringIO(), io.StringIO()
+    write_selection(rows, tsv, markup)
+    return tsv.getvalue(), markup.getvalue()
+
+
+def parse_tsv(text):
+    """Rows of cell text from clipboard TSV; quoted cells may hold tabs or line breaks."""
+    if not text:
+        return []
+    return list(csv.reader(io.StringIO(text), dialect="excel-tab"))
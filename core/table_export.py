@@ -0,0 +1,96 @@
+import os
+import csv
+import math
+
+from core.obr_table import AMOUNT_COLUMNS
+from core.cancellation import check_cancelled
+
+# Rows written between progress reports / cancellation checks
+EXPORT_CHUNK_ROWS = 1000
+AMOUNT_FORMAT = "#,##0.00"
+EXPORT_FORMATS = (".csv", ".xlsx", ".pdf")
+
+
+def _write_csv(table, f, progress, should_stop):
+    writer = csv.writer(f)
+    writer.writerow(table.columns)
+    for row in range(len(table)):
+        if row % EXPORT_CHUNK_ROWS == 0:
+            check_cancelled(should_stop)
+            progress(row)
+        writer.writerow(table.row_texts(row))
+    writer.writerow(table.totals_texts())
+
+
+def _write_xlsx(table, path, progress, should_stop):
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    # Write-only mode streams rows to disk instead of keeping the workbook in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("OBR")
+    bold = Font(bold=True)
+    sheet.append(table.columns)
+
+    def amount_cell(value, font=None):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.number_format = AMOUNT_FORMAT
+        if font is not None:
+            cell.font = font
+        return cell
+
+    try:
+        for row in range(len(table)):
+            if row % EXPORT_CHUNK_ROWS == 0:
+                check_cancelled(should_stop)
+                progress(row)
+            # Only amount cells need a cell object (for the number format); the rest go in as plain values
+            values = [table.text(row, col) or None for col in range(len(table.columns))]
+            for col in AMOUNT_COLUMNS:
+                value = table.amounts(col)[row]
+                if not math.isnan(value):
+                    values[col] = amount_cell(value)
+            sheet.append(values)
+    except BaseException:
+        # Finish the part-written sheet so its temporary file is released
+        sheet.close()
+        raise
+
+    totals = [WriteOnlyCell(sheet, value=text or None) for text in table.totals_texts()]
+    for cell in totals:
+        cell.font = bold
+    for col, value in zip(AMOUNT_COLUMNS, table.totals()):
+        totals[col] = amount_cell(value, bold)
+    sheet.append(totals)
+    workbook.save(path)
+
+
+def export_table(table, path, progress=None, should_stop=None):
+    """
+    Writes an OBRTable and its TOTAL row to a .csv, .xlsx or .pdf file, a chunk of rows
+    at a time. `progress(rows_done)` is called between chunks. The file is
+    written under a temporary name and only replaces `path` once complete, so a
+    cancelled (OperationCancelled) or failed export leaves nothing behind.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {ext or path}")
+    progress = progress or (lambda rows_done: None)
+
+    tmp_path = f"{path}.part"
+    try:
+        if ext == ".csv":
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                _write_csv(table, f, progress, should_stop)
+        elif ext == ".xlsx":
+            _write_xlsx(table, tmp_path, progress, should_stop)
+        else:
+            from core.pdf_report import write_pdf_report
+            write_pdf_report(table, tmp_path, progress, should_stop)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    progress(len(table))
@@ -0,0 +1,168 @@
+import re
+import sys
+import operator
+from collections import Counter
+
+import numpy as np
+
+from core.obr_table import AMOUNT_COLUMNS, INTERNED_COLUMNS
+
+# Short names accepted in queries besides the full column headers
+COLUMN_ALIASES = {
+    "file": 0, "filename": 0, "serial": 1, "amount": 5, "total": 5,
+}
+COMPARISONS = {
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+    "=": operator.eq, "!=": operator.ne,
+}
+CLAUSE_PATTERN = re.compile(
+    r"^(?P<column>.+?)\s*(?P<op>\bcontains\b|>=|<=|!=|=|>|<)\s*(?P<value>.+)$", re.IGNORECASE
+)
+# " and " outside double quotes
+AND_PATTERN = re.compile(r'\s+and\s+(?=(?:[^"]*"[^"]*")*[^"]*$)', re.IGNORECASE)
+AMOUNT_CHARS = set("0123456789,.-")
+
+
+class QueryError(ValueError):
+    pass
+
+
+def normalize(text):
+    return text.lower()
+
+
+class SearchIndex:
+    """
+    Lower-cased copy of every cell, one list per column, kept in step with an
+    OBRTable so searches never re-normalize the table. Low-cardinality columns
+    share one string per distinct value, like the table itself, and keep a count
+    of those values so a column without any match is skipped without a scan.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.clear()
+
+    def clear(self):
+        self._cols = [[] for _ in self.table.columns]
+        self._distinct = {col: Counter() for col in INTERNED_COLUMNS if col < len(self._cols)}
+
+    def extend(self, first):
+        """Indexes the table rows from `first` on, after an append."""
+        for col, column in enumerate(self._cols):
+            for row in range(first, len(self.table)):
+                text = normalize(self.table.text(row, col))
+                column.append(sys.intern(text) if col in INTERNED_COLUMNS else text)
+            if col in self._distinct:
+                self._distinct[col].update(column[first:])
+
+    def update(self, row, col):
+        text = normalize(self.table.text(row, col))
+        distinct = self._distinct.get(col)
+        if distinct is not None:
+            old = self._cols[col][row]
+            distinct[old] -= 1
+            if not distinct[old]:
+                del distinct[old]
+            distinct[text] += 1
+        self._cols[col][row] = sys.intern(text) if col in INTERNED_COLUMNS else text
+
+    def reorder(self, order):
+        self._cols = [[column[i] for i in order] for column in self._cols]
+
+    def column(self, col):
+        return self._cols[col]
+
+    def could_contain(self, col, value):
+        """False when no cell of the column can contain `value`, without scanning it."""
+        if col in self._distinct:
+            return any(value in text for text in self._distinct[col])
+        if col in AMOUNT_COLUMNS:
+            # Formatted numbers only hold these characters; anything else can only be in kept non-numeric text
+            return set(value) <= AMOUNT_CHARS or any(value in normalize(text) for text in self.table.invalid_texts(col))
+        return True
+
+
+class Query:
+    """
+    Parsed search text. Clauses are joined with "and"; each one is either
+    `<column> contains <text>`, `<column> <op> <value>` (op is one of
+    > >= < <= = !=; ordering needs an amount column), or bare text matched
+    against every column. Values may be quoted. Raises QueryError for a
+    comparison that can't be evaluated.
+    """
+
+    def __init__(self, text, columns):
+        self.text = text
+        self.terms = []
+        for clause in AND_PATTERN.split(text.strip()):
+            if clause.strip():
+                self.terms.append(self._parse_clause(clause.strip(), columns))
+
+    def __bool__(self):
+        return bool(self.terms)
+
+    @staticmethod
+    def _parse_clause(clause, columns):
+        match = CLAUSE_PATTERN.match(clause)
+        col = _column_index(match.group("column"), columns) if match else None
+        if col is None:
+            return None, "contains", normalize(_unquote(clause))
+
+        op = match.group("op").lower()
+        value = _unquote(match.group("value").strip())
+        if op == "contains" or (col not in AMOUNT_COLUMNS and op in ("=", "!=")):
+            return col, op, normalize(value)
+        if col not in AMOUNT_COLUMNS:
+            raise QueryError(f"'{columns[col]}' is not an amount column; use contains, = or !=")
+        try:
+            return col, op, float(value.replace(",", ""))
+        except ValueError:
+            raise QueryError(f"'{value}' is not a number")
+
+    def rows(self, index, table, rows=None):
+        """Ascending table rows matching every clause, out of `rows` (default all)."""
+        # Numeric clauses first: they run over whole columns at once and narrow the rest
+        ordered = sorted(self.terms, key=lambda term: not isinstance(term[2], float))
+        candidates = np.arange(len(table)) if rows is None else np.asarray(rows, dtype=np.int64)
+        for col, op, value in ordered:
+            if isinstance(value, float):
+                amounts = np.array(table.amounts(col))[candidates]
+                # Blank cells never satisfy a comparison
+                with np.errstate(invalid="ignore"):
+                    candidates = candidates[COMPARISONS[op](np.round(amounts, 2), value) & ~np.isnan(amounts)]
+            else:
+                candidates = np.asarray(_text_matches(index, candidates.tolist(), col, op, value), dtype=np.int64)
+            if not len(candidates):
+                break
+        return candidates.tolist()
+
+
+def _text_matches(index, rows, col, op, value):
+    if col is None:
+        matches = set()
+        for c in range(len(index.table.columns)):
+            if index.could_contain(c, value):
+                column = index.column(c)
+                matches.update([row for row in rows if value in column[row]])
+        return sorted(matches)
+    column = index.column(col)
+    if op == "=":
+        return [row for row in rows if column[row] == value]
+    if op == "!=":
+        return [row for row in rows if column[row] != value]
+    return [row for row in rows if value in column[row]]
+
+
+def _column_index(name, columns):
+    name = normalize(_unquote(name.strip()))
+    for col, header in enumerate(columns):
+        if normalize(header) == name:
+            return col
+    return COLUMN_ALIASES.get(name)
+
+
+def _unquote(text):
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    return text
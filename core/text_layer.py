@@ -0,0 +1,75 @@
+from PyPDF2 import PdfReader
+
+from config.constants import DEFAULT_DPI, FULL_PAGE_DPI_TIERS
+from core.ocr_cache import ocr_pdf_page
+from core.form_profiles import profile_text
+from core.cancellation import OperationCancelled, check_cancelled
+
+SOURCE_TEXT_LAYER = "Text layer"
+SOURCE_REGIONS = "OCR (regions)"
+SOURCE_ANCHOR = "OCR (anchor)"
+SOURCE_OCR = "OCR"
+
+
+def read_text_layer(path, page=1, reader=None):
+    """
+    Embedded page text plus any filled AcroForm text fields, as 'name: value' lines.
+    Pass an open PdfReader as `reader` when reading several pages of one file.
+    """
+    reader = reader or PdfReader(path)
+    if page > len(reader.pages):
+        return ""
+
+    parts = [reader.pages[page - 1].extract_text() or ""]
+    fields = reader.get_form_text_fields() or {}
+    for name, value in fields.items():
+        if value:
+            parts.append(f"{name}: {value}")
+    return "\n".join(parts)
+
+
+def page_text(path, page=1, accept=None, image=None, profile=None, fields=None, stats=None, should_stop=None,
+              reader=None, region_accept=None, dpi_tiers=FULL_PAGE_DPI_TIERS, **ocr_options):
+    """
+    Returns (text, source) for one page. The embedded text layer is used when
+    `accept(text)` says it carries the fields we need; next the form profile's
+    field regions are OCR'd, and only then the whole page. Both OCR stages start
+    at a low DPI and re-render higher only while `accept` keeps failing; the
+    tier that worked is recorded in `stats` (a DpiStats) when given.
+    `dpi_tiers` limits the whole-page tiers, e.g. to one for pages that rarely
+    hold the field. `region_accept` replaces `accept` for the region stage when
+    region reads need a stricter check. `should_stop` is checked between stages and raises OperationCancelled.
+    """
+    try:
+        text = read_text_layer(path, page, reader)
+    except Exception:
+        text = ""
+
+    if text.strip() and (accept is None or accept(text)):
+        return text, SOURCE_TEXT_LAYER
+
+    if profile is not None and page == profile.page:
+        check_cancelled(should_stop)
+        region_accept = region_accept or accept
+        try:
+            text = profile_text(path, profile, fields, image, region_accept, stats, should_stop)
+        except OperationCancelled:
+            raise
+        except Exception:
+            text = ""
+        if text.strip() and (region_accept is None or region_accept(text)):
+            return text, SOURCE_REGIONS
+
+    for dpi in dpi_tiers:
+        check_cancelled(should_stop)
+        # A pre-rendered image is only reused at the DPI it was rendered at
+        tier_image = image if dpi == DEFAULT_DPI else None
+        text = ocr_pdf_page(path, page=page, dpi=dpi, image=tier_image, **ocr_options)
+        if accept is None or accept(text):
+            if stats is not None:
+                stats.record("page", dpi)
+            return text, SOURCE_OCR
+
+    if stats is not None:
+        stats.record_failure("page")
+    return text, SOURCE_OCR
@@ -0,0 +1,69 @@
+from core.edit_history import EditCommand, EditHistory
+
+
+def test_unchanged_cells_are_dropped():
+    command = EditCommand("Edit", [(0, 3, "a", "a"), (1, 3, "a", "b")])
+
+    assert len(command) == 1
+    assert command.redo_cells() == [(1, 3, "b")]
+
+
+def test_undo_restores_latest_change_first():
+    history = EditHistory()
+    history.push("Paste", [(0, 5, "1.00", "2.00"), (0, 8, "1.00", "2.00")])
+
+    command = history.undo()
+
+    assert command.label == "Paste"
+    assert command.undo_cells() == [(0, 8, "1.00"), (0, 5, "1.00")]
+    assert not history.can_undo() and history.can_redo()
+    assert history.redo() is command
+
+
+def test_push_clears_redo_and_ignores_no_op_edits():
+    history = EditHistory()
+    history.push("Edit", [(0, 3, "a", "b")])
+    history.undo()
+
+    assert history.push("Edit", [(0, 3, "a", "a")]) is None
+    assert history.can_redo()
+    history.push("Edit", [(0, 3, "a", "c")])
+    assert not history.can_redo()
+
+
+def test_amend_groups_the_recalculated_balance():
+    history = EditHistory()
+    history.push("Edit", [(2, 5, "1.00", "3.00")])
+    history.amend([(2, 8, "1.00", "3.00")])
+
+    assert history.undo().undo_cells() == [(2, 8, "1.00"), (2, 5, "1.00")]
+
+
+def test_oldest_commands_are_evicted_at_the_entry_cap():
+    history = EditHistory(max_entries=2)
+    for n in range(3):
+        history.push(f"Edit {n}", [(n, 3, "", str(n))])
+
+    assert history.undo().label == "Edit 2"
+    assert history.undo().label == "Edit 1"
+    assert history.undo() is None
+
+
+def test_byte_cap_keeps_the_newest_command():
+    history = EditHistory(max_bytes=1)
+    history.push("Edit", [(0, 3, "", "x" * 100)])
+
+    assert history.can_undo()
+
+
+def test_commands_follow_a_sort():
+    history = EditHistory()
+    history.push("Edit", [(0, 3, "a", "b")])
+    history.push("Edit", [(2, 3, "c", "d")])
+    history.undo()
+
+    history.reorder([2, 0, 1])
+
+    assert history.undo().undo_cells() == [(1, 3, "a")]
+    assert history.redo().redo_cells() == [(1, 3, "b")]
+    assert history.redo().redo_cells() == [(0, 3, "d")]
@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+from core.manifest import FolderManifest
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for name in ("a.pdf", "b.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF " + name.encode())
+    return tmp_path
+
+
+def test_recorded_results_survive_a_reload(folder):
+    manifest = FolderManifest(str(folder))
+    manifest.record("extract", "a.pdf", ["a.pdf", "1"])
+    manifest.save()
+
+    todo, done = FolderManifest(str(folder)).partition("extract", ["a.pdf", "b.pdf"])
+
+    assert todo == ["b.pdf"]
+    assert done == {"a.pdf": ["a.pdf", "1"]}
+
+
+def test_changed_file_is_processed_again(folder):
+    manifest = FolderManifest(str(folder))
+    manifest.record("extract", "a.pdf", "old")
+    (folder / "a.pdf").write_bytes(b"%PDF changed")
+
+    assert manifest.lookup("extract", "a.pdf") is None
+
+
+def test_new_rule_version_invalidates_results(folder):
+    manifest = FolderManifest(str(folder), rule_version=1)
+    manifest.record("extract", "a.pdf", "old")
+    manifest.save()
+
+    assert FolderManifest(str(folder), rule_version=2).lookup("extract", "a.pdf") is None
+
+
+def test_jobs_are_kept_apart(folder):
+    manifest = FolderManifest(str(folder))
+    manifest.record("rename-NCA", "a.pdf", "x")
+
+    assert manifest.lookup("extract", "a.pdf") is None
+    manifest.forget("rename-NCA", "a.pdf")
+    assert manifest.lookup("rename-NCA", "a.pdf") is None
+
+
+def test_partition_drops_entries_for_missing_files(folder):
+    manifest = FolderManifest(str(folder))
+    manifest.record("extract", "a.pdf", "a")
+    manifest.record("extract", "b.pdf", "b")
+    os.remove(folder / "b.pdf")
+
+    assert manifest.partition("extract", ["a.pdf"]) == ([], {"a.pdf": "a"})
+    manifest.save()
+    assert FolderManifest(str(folder)).partition("extract", ["a.pdf", "b.pdf"])[1] == {"a.pdf": "a"}
+
+
+def test_unreadable_manifest_starts_empty(folder):
+    with open(FolderManifest(str(folder)).path, "w") as f:
+        f.write("{not json")
+
+    assert FolderManifest(str(folder)).partition("extract", ["a.pdf"]) == (["a.pdf"], {})
@@ -0,0 +1,73 @@
+import math
+
+import pytest
+
+from core.obr_table import OBRTable, parse_amount_text
+
+
+def obr_row(name, total, payment="", tax=""):
+    return [name, name, "", "", "", total, payment, tax, total, "", "OCR"]
+
+
+@pytest.fixture
+def table():
+    table = OBRTable()
+    table.append_rows([obr_row("b.pdf", "2,000.50"), obr_row("a.pdf", ""), obr_row("c.pdf", "N/A")])
+    return table
+
+
+def test_parse_amount_text():
+    assert parse_amount_text("1,234.00") == 1234.0
+    assert math.isnan(parse_amount_text("  "))
+    assert parse_amount_text("N/A") is None
+
+
+def test_amount_cells_keep_their_text(table):
+    assert table.text(0, 5) == "2,000.50"
+    assert table.text(1, 5) == ""
+    assert table.text(2, 5) == "N/A"
+    assert table.amount(2, 5) == 0.0
+    assert table.invalid_texts(5) == ["N/A"]
+
+
+def test_totals_follow_edits(table):
+    assert table.totals() == [2000.5, 0, 0, 2000.5]
+
+    table.set_text(1, 5, "100")
+    table.set_text(1, 6, "40")
+    table.recalculate_balance(1)
+    table.set_text(0, 5, "oops")
+
+    assert table.totals() == [100.0, 40.0, 0, 2060.5]
+    assert table.text(1, 8) == "60.00"
+    assert table.totals_texts()[5] == "100.00"
+
+
+def test_sort_moves_invalid_text_with_its_row(table):
+    order = table.sort(0)
+
+    assert order == [1, 0, 2]
+    assert [table.text(row, 0) for row in range(len(table))] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert table.text(2, 5) == "N/A"
+
+
+def test_amount_sort_puts_blanks_last(table):
+    table.sort(5, descending=True)
+
+    assert [table.text(row, 0) for row in range(len(table))] == ["b.pdf", "a.pdf", "c.pdf"]
+
+
+def test_reorder_rejects_an_order_of_the_wrong_length(table):
+    with pytest.raises(ValueError):
+        table.reorder([1, 0])
+
+
+def test_copy_is_independent(table):
+    snapshot = table.copy()
+    table.set_text(0, 5, "1.00")
+    table.sort(0)
+    table.clear()
+
+    assert len(snapshot) == 3
+    assert snapshot.text(0, 5) == "2,000.50"
+    assert snapshot.totals()[0] == 2000.5
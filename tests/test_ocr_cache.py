@@ -0,0 +1,88 @@
+import itertools
+import types
+
+import pytest
+
+import core.ocr_cache as ocr_cache
+from core.ocr_cache import OCRCache, NullCache, configure_cache, get_cache, make_key, ocr_pdf_page
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # Strictly increasing clock so least-recently-used order never ties
+    clock = itertools.count(1)
+    monkeypatch.setattr(ocr_cache, "time", types.SimpleNamespace(time=lambda: next(clock)))
+    cache = OCRCache(str(tmp_path / "cache.sqlite"), max_bytes=100)
+    yield cache
+    cache._conn.close()
+
+
+@pytest.fixture
+def configured(tmp_path):
+    configure_cache(str(tmp_path / "shared.sqlite"))
+    yield get_cache()
+    get_cache()._conn.close()
+    configure_cache()
+
+
+def test_get_returns_what_was_put(cache):
+    key = make_key("page", "digest", 1, 200, "eng", "")
+
+    assert cache.get(key) is None
+    cache.put(key, "Serial No. 1")
+    assert cache.get(key) == "Serial No. 1"
+
+
+def test_file_digest_follows_content_not_path(cache, tmp_path):
+    first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    first.write_bytes(b"%PDF same")
+    second.write_bytes(b"%PDF same")
+
+    digest = cache.file_digest(str(first))
+    assert cache.file_digest(str(second)) == digest
+
+    first.write_bytes(b"%PDF edited")
+    assert cache.file_digest(str(first)) != digest
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.put("a", "x" * 40)
+    cache.put("b", "x" * 40)
+    cache.get("a")
+
+    cache.put("c", "x" * 40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_clear_empties_the_cache(cache):
+    cache.put("a", "text")
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_disabled_cache_never_hits():
+    configure_cache(enabled=False)
+    try:
+        cache = get_cache()
+        cache.put("a", "text")
+        assert isinstance(cache, NullCache)
+        assert cache.get("a") is None
+    finally:
+        configure_cache()
+
+
+def test_pages_are_ocrd_once(configured, tmp_path, monkeypatch):
+    pdf = tmp_path / "scan.pdf"
+    pdf.write_bytes(b"%PDF scan")
+    calls = []
+    monkeypatch.setattr(ocr_cache, "render_page", lambda path, page, dpi: (path, page, dpi))
+    monkeypatch.setattr(ocr_cache, "image_to_string", lambda image, lang, config: calls.append(image) or "text")
+
+    assert ocr_pdf_page(str(pdf), dpi=150) == "text"
+    assert ocr_pdf_page(str(pdf), dpi=150) == "text"
+    assert len(calls) == 1
+    ocr_pdf_page(str(pdf), dpi=300)
+    assert len(calls) == 2
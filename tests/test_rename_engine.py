@@ -0,0 +1,90 @@
+import pytest
+
+import core.rename_engine as rename_engine
+from core.rename_engine import (
+    RenameCandidate, already_named, normalize_name, apply_rename, auto_rename, iter_analyze,
+)
+from core.rename_parsers import parse_obr_serial, parse_nca_number, parse_saro_guesses, confident_saro_number
+
+
+def test_obr_serial():
+    assert parse_obr_serial("Serial No.: MOOE-2024-01-0012\nDate") == "MOOE-2024-01-0012"
+    assert parse_obr_serial("no serial here") is None
+
+
+def test_nca_number_is_read_above_the_anchor():
+    text = "Header\nNCA-BMB-E-24-0001234\n2067 Notice of Cash Allocation\n"
+    assert parse_nca_number(text) == "NCA-BMB-E-24-0001234"
+    assert parse_nca_number("NCA-BMB-E-24-0001234\nno anchor") is None
+
+
+def test_saro_guesses_and_confidence():
+    guesses = parse_saro_guesses("SARO No.: 01-12345\nA-01-12345\n")
+    assert guesses == ["A-01-12345"]
+    assert confident_saro_number(guesses) == "A-01-12345"
+    assert confident_saro_number(["A-01-12345", "B-02-54321"]) is None
+
+
+def test_already_named():
+    assert already_named("OBR", "MOOE-2024-01-0012.pdf")
+    assert already_named("NCA", "NCA-BMB-E-24-0001234.pdf")
+    assert already_named("SARO", "A-01-12345.pdf")
+    assert not already_named("NCA", "scan 001.pdf")
+
+
+def test_normalize_name():
+    assert normalize_name("OBR", " MOOE-1.pdf ") == "MOOE-1"
+    assert normalize_name("SARO", "01-12345") == "A-01-12345"
+
+
+def test_candidate_round_trips_through_the_manifest():
+    candidate = RenameCandidate("/in/scan.pdf", "NCA", ["NCA-X"], True, "OCR")
+
+    copy = RenameCandidate.from_dict(candidate.path, "NCA", candidate.as_dict())
+
+    assert (copy.filename, copy.suggestion, copy.confident, copy.source) == ("scan.pdf", "NCA-X", True, "OCR")
+
+
+def test_apply_rename(tmp_path):
+    (tmp_path / "scan.pdf").write_bytes(b"%PDF")
+    (tmp_path / "taken.pdf").write_bytes(b"%PDF")
+    candidate = RenameCandidate(str(tmp_path / "scan.pdf"), "OBR", ["MOOE-1"], True, "OCR")
+
+    assert apply_rename(candidate, "") == (False, "scan.pdf (manual input blank)")
+    assert apply_rename(candidate, "taken")[0] is False
+    assert auto_rename(candidate) == (True, "scan.pdf ➔ MOOE-1.pdf (OCR)")
+    assert (tmp_path / "MOOE-1.pdf").exists() and not (tmp_path / "scan.pdf").exists()
+
+
+def test_iter_analyze_reports_errors_and_stops(monkeypatch):
+    def analyze(path, stats, should_stop):
+        if path.endswith("bad.pdf"):
+            raise ValueError("unreadable")
+        return RenameCandidate(path, "OBR", [], False)
+
+    monkeypatch.setitem(rename_engine.ANALYZERS, "OBR", analyze)
+    files = ["a.pdf", "bad.pdf", "c.pdf"]
+
+    results = [(i, name, error is None) for i, name, _, error in iter_analyze("OBR", "/in", files)]
+    assert results == [(0, "a.pdf", True), (1, "bad.pdf", False), (2, "c.pdf", True)]
+
+    seen = []
+    for i, *_ in iter_analyze("OBR", "/in", files, should_stop=lambda: len(seen) == 1):
+        seen.append(i)
+    assert seen == [0]
+
+
+def test_nca_falls_back_to_the_whole_page_when_the_anchor_stage_fails(monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("cannot render")
+
+    monkeypatch.setattr(rename_engine, "read_text_layer", fail)
+    monkeypatch.setattr(rename_engine, "anchor_text", fail)
+    monkeypatch.setattr(
+        rename_engine, "page_text", lambda path, **kwargs: ("NCA-BMB-E-24-0001234\n2067", "OCR"),
+    )
+
+    candidate = rename_engine.analyze_nca("/in/scan.pdf")
+
+    assert candidate.suggestions == ["NCA-BMB-E-24-0001234"]
+    assert candidate.confident
@@ -0,0 +1,54 @@
+import pytest
+
+from core.obr_table import OBRTable
+from core.session_store import SessionStore
+
+
+def obr_row(name, total):
+    return [name, name, "", "", "", total, "", "", total, "", "OCR"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(str(tmp_path / "session.sqlite"))
+    store.start("folder", OBRTable().columns)
+    yield store
+    store.close()
+
+
+def test_restore_replays_edits_over_rows(store):
+    store.append_rows([obr_row("a.pdf", "1.00"), obr_row("b.pdf", "2.00")])
+    store.journal_cells([(1, 9, "checked"), (0, 5, "4.00")])
+
+    folder, table = store.restore()
+
+    assert folder == "folder"
+    assert table.text(1, 9) == "checked"
+    assert table.totals() == [6.0, 0, 0, 3.0]
+
+
+def test_restore_keeps_rows_appended_after_a_sort(store):
+    live = OBRTable()
+    rows = [obr_row("b.pdf", "2.00"), obr_row("a.pdf", "4.00")]
+    live.append_rows(rows)
+    store.append_rows(rows)
+    store.journal_order(live.sort(0))
+    late = [obr_row("c.pdf", "3.00")]
+    live.append_rows(late)
+    store.append_rows(late)
+
+    _, table = store.restore()
+
+    assert list(table.rows()) == list(live.rows())
+    assert table.totals() == [9.0, 0, 0, 9.0]
+
+
+def test_compact_folds_the_journal_into_the_rows(store):
+    store.append_rows([obr_row("b.pdf", "2.00"), obr_row("a.pdf", "4.00")])
+    store.journal_order([1, 0])
+    _, table = store.restore()
+
+    store.compact(table)
+
+    assert store.journal_size() == 0
+    assert list(store.restore()[1].rows()) == list(table.rows())
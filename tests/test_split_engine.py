@@ -0,0 +1,64 @@
+import os
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+
+from core.split_engine import parse_page_ranges, plan_split, iter_split, close_readers
+
+
+def make_pdf(path, pages, bookmarks=()):
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    for title, page in bookmarks:
+        writer.add_outline_item(title, page)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def readers():
+    yield
+    close_readers()
+
+
+def test_parse_page_ranges():
+    assert parse_page_ranges("1-3, 5, 8-", 10) == [(1, 3), (5, 5), (8, 10)]
+    assert parse_page_ranges("-2,", 10) == [(1, 2)]
+
+
+@pytest.mark.parametrize("text", ["", "a", "0", "3-1", "4-12", "-"])
+def test_parse_page_ranges_rejects(text):
+    with pytest.raises(ValueError):
+        parse_page_ranges(text, 10)
+
+
+def test_plan_split_modes(tmp_path):
+    pdf = make_pdf(tmp_path / "in.pdf", 5, bookmarks=[("Intro / One", 1), ("Two", 3)])
+
+    assert plan_split(pdf)[0] == ("page_1.pdf", [0])
+    assert plan_split(pdf, "ranges", "2-3, 5") == [("pages_2-3.pdf", [1, 2]), ("page_5.pdf", [4])]
+    assert plan_split(pdf, "chunks", chunk_size=2) == [
+        ("pages_1-2.pdf", [0, 1]), ("pages_3-4.pdf", [2, 3]), ("page_5.pdf", [4]),
+    ]
+    assert plan_split(pdf, "bookmarks") == [
+        ("01_Front_matter.pdf", [0]), ("02_Intro__One.pdf", [1, 2]), ("03_Two.pdf", [3, 4]),
+    ]
+
+
+def test_iter_split_writes_parts_and_reports_bad_inputs(tmp_path):
+    good = make_pdf(tmp_path / "good.pdf", 4)
+    short = make_pdf(tmp_path / "short.pdf", 1)
+    out = tmp_path / "out"
+
+    events = list(iter_split([good, short], str(out), "ranges", "1-2, 4", workers=1))
+
+    assert events[0][2] == short
+    assert isinstance(events[0][3], ValueError)
+    written = [path for _, _, path, error in events[1:] if error is None]
+    assert [os.path.relpath(path, out) for path in written] == [
+        os.path.join("good", "pages_1-2.pdf"), os.path.join("good", "page_4.pdf"),
+    ]
+    assert [done for done, _, _, _ in events] == [1, 2, 3]
+    assert len(PdfReader(written[0]).pages) == 2
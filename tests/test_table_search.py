@@ -0,0 +1,72 @@
+import pytest
+
+from core.obr_table import OBRTable
+from core.table_search import SearchIndex, Query, QueryError
+
+
+def obr_row(name, payee, total):
+    return [name, name, "", payee, "", total, "", "", total, "", "OCR"]
+
+
+@pytest.fixture
+def table():
+    table = OBRTable()
+    table.append_rows([
+        obr_row("a.pdf", "ACME Corp", "1,500.00"),
+        obr_row("b.pdf", "Globex", "250.00"),
+        obr_row("c.pdf", "Acme Supply", ""),
+        obr_row("d.pdf", "Initech", "N/A"),
+    ])
+    return table
+
+
+@pytest.fixture
+def index(table):
+    index = SearchIndex(table)
+    index.extend(0)
+    return index
+
+
+def search(text, index, table, rows=None):
+    return Query(text, table.columns).rows(index, table, rows)
+
+
+def test_bare_text_matches_any_column_case_insensitively(index, table):
+    assert search("acme", index, table) == [0, 2]
+    assert search("", index, table) == [0, 1, 2, 3]
+
+
+def test_column_clauses(index, table):
+    assert search("payee contains acme and amount > 1000", index, table) == [0]
+    assert search('payee = "globex"', index, table) == [1]
+    assert search("total <= 250", index, table) == [1]
+    assert search("file != a.pdf", index, table) == [1, 2, 3]
+
+
+def test_comparisons_skip_blank_and_non_numeric_cells(index, table):
+    assert search("amount >= 0", index, table) == [0, 1]
+
+
+def test_plain_search_finds_non_numeric_text_in_amount_columns(index, table):
+    assert search("n/a", index, table) == [3]
+
+
+def test_search_narrows_a_row_subset(index, table):
+    assert search("acme", index, table, rows=[1, 2, 3]) == [2]
+
+
+def test_index_follows_edits_and_sorts(index, table):
+    table.set_text(1, 3, "Acme West")
+    index.update(1, 3)
+    assert search("payee contains acme", index, table) == [0, 1, 2]
+
+    index.reorder(table.sort(0, descending=True))
+    assert search("globex", index, table) == []
+    assert search("west", index, table) == [2]
+
+
+def test_invalid_comparisons_raise(table):
+    with pytest.raises(QueryError):
+        Query("payee > 5", table.columns)
+    with pytest.raises(QueryError):
+        Query("amount > lots", table.columns)
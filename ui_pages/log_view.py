@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QPlainTextEdit
+
+from config.constants import LOG_VIEW_MAX_LINES
+
+
+class LogView(QPlainTextEdit):
+    """
+    Read-only log panel that keeps only the last `max_lines` lines. Lines
+    appended during one event-loop pass are added in a single update, and the
+    whole batch is handed to `spill(messages)` (a list of (timestamp, line)) so
+    the complete log can live on disk.
+    """
+
+    def __init__(self, spill=None, max_lines=LOG_VIEW_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+        self.spill = spill
+        self.max_lines = max_lines
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append(self, line):
+        self._pending.append((datetime.now(), line))
+        self._flush_timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if self.spill is not None:
+            self.spill(pending)
+        self.appendPlainText("\n".join(line for _, line in pending[-self.max_lines:]))
+        scroll = self.verticalScrollBar()
+        scroll.setValue(scroll.maximum())
@@ -0,0 +1,311 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QTableView, QAbstractItemView, QHeaderView
+
+from core.obr_table import OBRTable, AMOUNT_COLUMNS
+from core.table_search import SearchIndex
+
+
+class OBRTableModel(QAbstractTableModel):
+    """
+    Qt model over an OBRTable. Only visible cells are ever asked for, so large
+    tables cost no per-cell objects. Totals are shown by TotalsFooter, not as a row.
+
+    With a filter set only the matching rows are shown. Model rows are then view
+    positions; methods taking a plain `row` mean the table row (see source_row).
+    """
+
+    # row, column, old text, new text; emitted for edits made through the view
+    cellEdited = pyqtSignal(int, int, str, str)
+    totalsChanged = pyqtSignal()
+    # new row order after a sort: old table row order[i] is now row i
+    rowsReordered = pyqtSignal(object)
+    # every (row, col, text) written after rows arrive, edits and recalculations alike
+    cellsWritten = pyqtSignal(list)
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.table = OBRTable(columns)
+        self.search_index = SearchIndex(self.table)
+        self.highlighted = set()
+        self.query = None
+        self._visible = None
+        self._view_rows = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.table) if self._visible is None else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def source_row(self, view_row):
+        return view_row if self._visible is None else self._visible[view_row]
+
+    def view_row(self, row):
+        """Model row showing table row `row`, or None while it's filtered out."""
+        return row if self._view_rows is None else self._view_rows.get(row)
+
+    def text(self, row, col):
+        return self.table.text(row, col)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = self.source_row(index.row()), index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self.table.text(row, col)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter | Qt.AlignVCenter) if col != 0 else None
+        if role == Qt.ToolTipRole:
+            return self.table.text(row, col) or None
+        if role == Qt.BackgroundRole:
+            return QColor("cyan") if row in self.highlighted else None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section]
+        return self.source_row(section) + 1
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        self.edit_text(self.source_row(index.row()), index.column(), str(value))
+        return True
+
+    def edit_text(self, row, col, text):
+        """A user edit of a table cell: changes it and emits cellEdited."""
+        old = self.table.text(row, col)
+        self.set_text(row, col, text)
+        self.cellEdited.emit(row, col, old, self.table.text(row, col))
+
+    def set_text(self, row, col, text):
+        """Changes a cell without emitting cellEdited (undo/redo, recalculation)."""
+        self.table.set_text(row, col, text)
+        self.search_index.update(row, col)
+        self._cell_changed(row, col)
+        self.cellsWritten.emit([(row, col, self.table.text(row, col))])
+        if col in AMOUNT_COLUMNS:
+            self.totalsChanged.emit()
+
+    def set_texts(self, cells):
+        """
+        Changes many (row, col, text) cells as one update: a single repaint and
+        totals refresh, no cellEdited. Returns the cells' previous (row, col, text).
+        """
+        old = []
+        for row, col, text in cells:
+            old.append((row, col, self.table.text(row, col)))
+            self.table.set_text(row, col, text)
+            self.search_index.update(row, col)
+        self._cells_changed([(row, col) for row, col, _ in cells])
+        self.cellsWritten.emit([(row, col, self.table.text(row, col)) for row, col, _ in cells])
+        if any(col in AMOUNT_COLUMNS for _, col, _ in cells):
+            self.totalsChanged.emit()
+        return old
+
+    def update_balance(self, row):
+        return self.update_balances([row])
+
+    def update_balances(self, rows):
+        """
+        Recomputes these rows' Balance; the totals follow by difference.
+        Returns the (row, col, old, new) balance changes.
+        """
+        changes = []
+        for row in rows:
+            old = self.table.text(row, 8)
+            self.table.recalculate_balance(row)
+            self.search_index.update(row, 8)
+            changes.append((row, 8, old, self.table.text(row, 8)))
+        self._cells_changed([(row, 8) for row in rows])
+        self.cellsWritten.emit([(row, col, new) for row, col, _, new in changes])
+        self.totalsChanged.emit()
+        return changes
+
+    def _cell_changed(self, row, col):
+        # A filtered row keeps its place until the filter is next applied
+        view_row = self.view_row(row)
+        if view_row is not None:
+            index = self.index(view_row, col)
+            self.dataChanged.emit(index, index)
+
+    def _cells_changed(self, cells):
+        if len(cells) == 1:
+            self._cell_changed(*cells[0])
+            return
+        view_rows = [self.view_row(row) for row, _ in cells]
+        view_rows = [row for row in view_rows if row is not None]
+        if view_rows:
+            cols = [col for _, col in cells]
+            self.dataChanged.emit(self.index(min(view_rows), min(cols)), self.index(max(view_rows), max(cols)))
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        first = len(self.table)
+        self.table.append_rows(rows)
+        self.search_index.extend(first)
+        if self._visible is None:
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self.endInsertRows()
+        else:
+            # Rows arriving while filtered show up only if they match
+            matches = self.query.rows(self.search_index, self.table, range(first, len(self.table)))
+            if matches:
+                start = len(self._visible)
+                self.beginInsertRows(QModelIndex(), start, start + len(matches) - 1)
+                self._visible.extend(matches)
+                self._view_rows.update((row, start + i) for i, row in enumerate(matches))
+                self.endInsertRows()
+        self.totalsChanged.emit()
+
+    def clear(self):
+        self.beginResetModel()
+        self.table.clear()
+        self.search_index.clear()
+        self.highlighted = set()
+        if self._visible is not None:
+            self._visible, self._view_rows = [], {}
+        self.endResetModel()
+        self.totalsChanged.emit()
+
+    def set_table(self, table):
+        """Shows an already filled OBRTable (e.g. a restored session) in place of the current one."""
+        self.beginResetModel()
+        self.table = table
+        self.search_index = SearchIndex(table)
+        self.search_index.extend(0)
+        self.highlighted = set()
+        if self._visible is not None:
+            self._visible = self.matching_rows(self.query)
+            self._view_rows = {row: i for i, row in enumerate(self._visible)}
+        self.endResetModel()
+        self.totalsChanged.emit()
+
+    def matching_rows(self, query):
+        return query.rows(self.search_index, self.table)
+
+    def set_filter(self, query, rows=None):
+        """Shows only the rows matching `query` (all rows for None); `rows` are its matches if known."""
+        self.beginResetModel()
+        self.query = query
+        if query is None:
+            self._visible = self._view_rows = None
+        else:
+            self._visible = list(rows) if rows is not None else self.matching_rows(query)
+            self._view_rows = {row: i for i, row in enumerate(self._visible)}
+        self.endResetModel()
+
+    def set_highlighted(self, rows):
+        self.highlighted = set(rows)
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, len(self.columns) - 1),
+                                  [Qt.BackgroundRole])
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_rows = [self.source_row(index.row()) for index in old_indexes]
+        new_order = self.table.sort(column, descending=order == Qt.DescendingOrder)
+        self.search_index.reorder(new_order)
+        position = {old: new for new, old in enumerate(new_order)}
+        self.highlighted = {position[row] for row in self.highlighted}
+        if self._visible is not None:
+            shown = set(self._visible)
+            self._visible = [new for new, old in enumerate(new_order) if old in shown]
+            self._view_rows = {row: i for i, row in enumerate(self._visible)}
+        new_indexes = [
+            self.index(self.view_row(position[row]), index.column()) for row, index in zip(old_rows, old_indexes)
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+        self.rowsReordered.emit(new_order)
+
+
+class TotalsModel(QAbstractTableModel):
+    """The single TOTAL row, read from the running sums of an OBRTableModel."""
+
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self._bold = QFont()
+        self._bold.setBold(True)
+        source.totalsChanged.connect(self.refresh)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return self.source.columnCount(parent)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.source.table.totals_texts()[index.column()]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter | Qt.AlignVCenter)
+        if role == Qt.ToolTipRole:
+            return "Summary Total"
+        if role == Qt.BackgroundRole:
+            return QColor(Qt.lightGray)
+        if role == Qt.FontRole:
+            return self._bold
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Vertical:
+            return "Σ"
+        return None
+
+    def refresh(self):
+        self.dataChanged.emit(self.index(0, 0), self.index(0, self.columnCount() - 1))
+
+
+class TotalsFooter(QTableView):
+    """
+    TOTAL row pinned under a table view: it never scrolls or sorts away, and its
+    columns follow the table's widths and horizontal scroll position.
+    """
+
+    def __init__(self, table_view, table_model, parent=None):
+        super().__init__(parent)
+        self.table_view = table_view
+        self.setModel(TotalsModel(table_model, self))
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFixedHeight(self.verticalHeader().defaultSectionSize() + 2 * self.frameWidth())
+
+        table_view.horizontalHeader().sectionResized.connect(lambda col, old, new: self.setColumnWidth(col, new))
+        table_view.horizontalScrollBar().valueChanged.connect(self.horizontalScrollBar().setValue)
+        # The row-number header widens as rows are added; keep the columns lined up
+        table_model.rowsInserted.connect(self.schedule_sync)
+        table_model.modelReset.connect(self.schedule_sync)
+        self.schedule_sync()
+
+    def schedule_sync(self, *args):
+        QTimer.singleShot(0, self.sync_geometry)
+
+    def sync_geometry(self):
+        self.verticalHeader().setFixedWidth(self.table_view.verticalHeader().width())
+        for col in range(self.model().columnCount()):
+            self.setColumnWidth(col, self.table_view.columnWidth(col))
+        self.horizontalScrollBar().setValue(self.table_view.horizontalScrollBar().value())
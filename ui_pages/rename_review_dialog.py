@@ -0,0 +1,160 @@
+import os
+import platform
+import subprocess
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox, QListWidget, QShortcut
+)
+from PyQt5.QtGui import QPixmap, QKeySequence
+from PyQt5.QtCore import Qt
+from core.form_profiles import get_profile
+from core.page_cache import cached_render_page
+from core.rasterize import crop_fraction
+from utils.image_utils import pil_image_to_qimage
+
+SHORTCUT_HELP = (
+    "Enter: rename & next   Ctrl+D: skip   PgUp/PgDn: previous/next   "
+    "Alt+1..3: pick suggestion   Ctrl+O: open file   Ctrl+Enter: apply all"
+)
+
+
+class RenameReviewDialog(QDialog):
+    """
+    One screen for every file the automatic pass could not rename with confidence.
+    Decisions are collected here and applied by the caller once the dialog is accepted.
+    """
+
+    def __init__(self, candidates, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Review Renames ({len(candidates)} files)")
+        self.setMinimumSize(1000, 600)
+        self.candidates = candidates
+        self.decisions = {}
+        self.index = 0
+
+        layout = QHBoxLayout()
+
+        self.list_widget = QListWidget()
+        self.list_widget.setFixedWidth(300)
+        for candidate in candidates:
+            self.list_widget.addItem(candidate.filename)
+        self.list_widget.currentRowChanged.connect(self.show_item)
+        layout.addWidget(self.list_widget)
+
+        right = QVBoxLayout()
+        self.title_label = QLabel()
+        right.addWidget(self.title_label)
+
+        self.preview_label = QLabel()
+        self.preview_label.setAlignment(Qt.AlignCenter)
+        self.preview_label.setMinimumSize(650, 400)
+        right.addWidget(self.preview_label, stretch=1)
+
+        right.addWidget(QLabel("🔍 Choose a suggestion or type below:"))
+        self.combo = QComboBox()
+        self.combo.setEditable(True)
+        self.combo.lineEdit().returnPressed.connect(self.accept_current)
+        right.addWidget(self.combo)
+
+        buttons = QHBoxLayout()
+        prev_btn = QPushButton("⬅ Previous")
+        prev_btn.clicked.connect(self.previous_item)
+        skip_btn = QPushButton("⏭ Skip")
+        skip_btn.clicked.connect(self.skip_current)
+        rename_btn = QPushButton("✅ Rename && Next")
+        rename_btn.clicked.connect(self.accept_current)
+        open_btn = QPushButton("📂 Open File")
+        open_btn.clicked.connect(self.open_file)
+        apply_btn = QPushButton("💾 Apply All")
+        apply_btn.clicked.connect(self.accept)
+        cancel_btn = QPushButton("❌ Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        for btn in (prev_btn, skip_btn, rename_btn, open_btn, apply_btn, cancel_btn):
+            # Enter belongs to the suggestion box; a default button would take the same press
+            btn.setAutoDefault(False)
+            btn.setDefault(False)
+            buttons.addWidget(btn)
+        right.addLayout(buttons)
+
+        hint = QLabel(SHORTCUT_HELP)
+        hint.setStyleSheet("color: gray;")
+        right.addWidget(hint)
+
+        layout.addLayout(right, stretch=1)
+        self.setLayout(layout)
+
+        QShortcut(QKeySequence("Ctrl+D"), self, activated=self.skip_current)
+        QShortcut(QKeySequence(Qt.Key_PageDown), self, activated=self.next_item)
+        QShortcut(QKeySequence(Qt.Key_PageUp), self, activated=self.previous_item)
+        QShortcut(QKeySequence("Ctrl+O"), self, activated=self.open_file)
+        QShortcut(QKeySequence("Ctrl+Return"), self, activated=self.accept)
+        for n in range(1, 4):
+            QShortcut(QKeySequence(f"Alt+{n}"), self, activated=lambda n=n: self.pick_suggestion(n - 1))
+
+        if candidates:
+            self.list_widget.setCurrentRow(0)
+
+    def show_item(self, row):
+        if row < 0 or row >= len(self.candidates):
+            return
+        self.index = row
+        candidate = self.candidates[row]
+        self.title_label.setText(f"{row + 1} / {len(self.candidates)} — {candidate.filename}")
+
+        self.combo.clear()
+        self.combo.addItems(candidate.suggestions)
+        decided = self.decisions.get(row)
+        self.combo.setEditText(decided if decided else candidate.suggestion)
+        self.combo.lineEdit().selectAll()
+        self.combo.setFocus()
+
+        try:
+            image = cached_render_page(candidate.path)
+            preview = pil_image_to_qimage(crop_fraction(image, get_profile(candidate.mode).preview))
+            scaled = preview.scaled(750, 450, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            self.preview_label.setPixmap(QPixmap.fromImage(scaled))
+        except Exception as e:
+            self.preview_label.setText(f"⚠ Failed to load image preview: {e}")
+
+    def mark(self, row, text):
+        self.list_widget.item(row).setText(text)
+
+    def accept_current(self):
+        name = self.combo.currentText().strip()
+        candidate = self.candidates[self.index]
+        if name:
+            self.decisions[self.index] = name
+            self.mark(self.index, f"✔ {candidate.filename} ➔ {name}")
+        else:
+            self.decisions.pop(self.index, None)
+            self.mark(self.index, f"✖ {candidate.filename}")
+        self.next_item()
+
+    def skip_current(self):
+        self.decisions.pop(self.index, None)
+        self.mark(self.index, f"✖ {self.candidates[self.index].filename}")
+        self.next_item()
+
+    def pick_suggestion(self, n):
+        if n < self.combo.count():
+            self.combo.setCurrentIndex(n)
+
+    def next_item(self):
+        if self.index + 1 < len(self.candidates):
+            self.list_widget.setCurrentRow(self.index + 1)
+
+    def previous_item(self):
+        if self.index > 0:
+            self.list_widget.setCurrentRow(self.index - 1)
+
+    def open_file(self):
+        path = self.candidates[self.index].path
+        if platform.system() == "Windows":
+            os.startfile(path)
+        elif platform.system() == "Darwin":
+            subprocess.call(["open", path])
+        else:
+            subprocess.call(["xdg-open", path])
+
+    def results(self):
+        """[(candidate, chosen name or None), ...] in queue order."""
+        return [(candidate, self.decisions.get(i)) for i, candidate in enumerate(self.candidates)]
@@ -1,80 +1,245 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QProgressBar, QFileDialog
-from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
-from core.pdf_utils import split_pdf, show_warning
-from config.constants import FONT_SIZE, DEFAULT_FONT, SECONDARY_COLOR
-
-class SplitPage(QWidget):
-    def __init__(self, switch_page):
-        super().__init__()
-        self.switch_page = switch_page
-        self.initUI()
-
-    def initUI(self):
-        layout = QVBoxLayout()
-        title = QLabel("Split PDF into Individual Pages")
-        title.setStyleSheet(f"background-color: {SECONDARY_COLOR}; color: black; font: bold 14pt '{DEFAULT_FONT}';")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-
-        form_layout1 = QHBoxLayout()
-        self.input_entry = QLineEdit()
-        self.input_entry.setPlaceholderText("Select PDF file")
-        self.input_entry.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        form_layout1.addWidget(self.input_entry)
-
-        btn_browse_pdf = QPushButton("📂 Select PDF")
-        btn_browse_pdf.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        btn_browse_pdf.clicked.connect(self.browse_pdf)
-        form_layout1.addWidget(btn_browse_pdf)
-        layout.addLayout(form_layout1)
-
-        form_layout2 = QHBoxLayout()
-        self.output_entry = QLineEdit()
-        self.output_entry.setPlaceholderText("Select output folder")
-        self.output_entry.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        form_layout2.addWidget(self.output_entry)
-
-        btn_browse_folder = QPushButton("📁 Select Output Folder")
-        btn_browse_folder.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        btn_browse_folder.clicked.connect(self.browse_folder)
-        form_layout2.addWidget(btn_browse_folder)
-        layout.addLayout(form_layout2)
-
-        self.output_text = QTextEdit()
-        self.output_text.setReadOnly(True)
-        self.output_text.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        layout.addWidget(self.output_text)
-
-        self.progress_bar = QProgressBar()
-        layout.addWidget(self.progress_bar)
-
-        btn_action = QPushButton("🚀 Start Splitting")
-        btn_action.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        btn_action.clicked.connect(self.start_splitting)
-        layout.addWidget(btn_action)
-
-        btn_back = QPushButton("⬅ Back")
-        btn_back.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
-        btn_back.clicked.connect(lambda: self.switch_page("main"))
-        layout.addWidget(btn_back)
-        self.setLayout(layout)
-
-    def browse_pdf(self):
-        fname, _ = QFileDialog.getOpenFileName(self, "Select PDF", "", "PDF Files (*.pdf)")
-        if fname:
-            self.input_entry.setText(fname)
-
-    def browse_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
-        if folder:
-            self.output_entry.setText(folder)
-
-    def start_splitting(self):
-        input_pdf = self.input_entry.text().strip()
-        output_folder = self.output_entry.text().strip()
-        if not input_pdf or not output_folder:
-            show_warning("Please select both input PDF and output folder.")
-            return
-        self.output_text.clear()
-        split_pdf(input_pdf, output_folder, self.output_text, self.progress_bar)
+import os
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QProgressBar, QFileDialog,
+    QComboBox, QSpinBox
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal
+from core.pdf_utils import show_warning
+from core.split_engine import iter_split
+from ui_pages.log_view import LogView
+from config.constants import FONT_SIZE, DEFAULT_FONT, SECONDARY_COLOR, SPLIT_WORKERS
+
+# Split mode labels shown in the combo box, in core.split_engine.SPLIT_MODES terms
+SPLIT_MODE_LABELS = (
+    ("Every page", "pages"),
+    ("Page ranges", "ranges"),
+    ("Chunks of N pages", "chunks"),
+    ("Top-level bookmarks", "bookmarks"),
+)
+
+
+class SplitWorker(QObject):
+    finished = pyqtSignal()
+    progress = pyqtSignal(int, int)
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, inputs, output_folder, mode, ranges="", chunk_size=1, workers=SPLIT_WORKERS):
+        super().__init__()
+        self.inputs = inputs
+        self.output_folder = output_folder
+        self.mode = mode
+        self.ranges = ranges
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.written = 0
+        self.errors = 0
+        self.was_cancelled = False
+        self._is_running = True
+
+    def cancel(self):
+        self._is_running = False
+
+    def run(self):
+        stop = lambda: not self._is_running
+        try:
+            for done, total, path, error in iter_split(
+                self.inputs, self.output_folder, self.mode, self.ranges, self.chunk_size, self.workers, stop
+            ):
+                if error is not None:
+                    self.errors += 1
+                    self.failed.emit(f"Error splitting {os.path.basename(path)}: {error}")
+                else:
+                    self.written += 1
+                    self.saved.emit(f"Saved: {path}")
+                self.progress.emit(done, total)
+        except Exception as e:
+            self.errors += 1
+            self.failed.emit(f"Error splitting PDF: {e}")
+        self.was_cancelled = not self._is_running
+        self.finished.emit()
+
+
+class SplitPage(QWidget):
+    def __init__(self, switch_page):
+        super().__init__()
+        self.switch_page = switch_page
+        self.split_thread = None
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        title = QLabel("Split PDF Files")
+        title.setStyleSheet(f"background-color: {SECONDARY_COLOR}; color: black; font: bold 14pt '{DEFAULT_FONT}';")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+
+        form_layout1 = QHBoxLayout()
+        self.input_entry = QLineEdit()
+        self.input_entry.setPlaceholderText("Select a PDF file, or a folder to split every PDF in it")
+        self.input_entry.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        form_layout1.addWidget(self.input_entry)
+
+        btn_browse_pdf = QPushButton("📂 Select PDF")
+        btn_browse_pdf.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        btn_browse_pdf.clicked.connect(self.browse_pdf)
+        form_layout1.addWidget(btn_browse_pdf)
+
+        btn_browse_input_folder = QPushButton("📁 Select Folder")
+        btn_browse_input_folder.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        btn_browse_input_folder.clicked.connect(self.browse_input_folder)
+        form_layout1.addWidget(btn_browse_input_folder)
+        layout.addLayout(form_layout1)
+
+        form_layout2 = QHBoxLayout()
+        self.output_entry = QLineEdit()
+        self.output_entry.setPlaceholderText("Select output folder")
+        self.output_entry.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        form_layout2.addWidget(self.output_entry)
+
+        btn_browse_folder = QPushButton("📁 Select Output Folder")
+        btn_browse_folder.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        btn_browse_folder.clicked.connect(self.browse_folder)
+        form_layout2.addWidget(btn_browse_folder)
+        layout.addLayout(form_layout2)
+
+        mode_layout = QHBoxLayout()
+        self.mode_combo = QComboBox()
+        self.mode_combo.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        for label, mode in SPLIT_MODE_LABELS:
+            self.mode_combo.addItem(label, mode)
+        self.mode_combo.currentIndexChanged.connect(self.update_mode_options)
+        mode_layout.addWidget(self.mode_combo)
+
+        self.ranges_entry = QLineEdit()
+        self.ranges_entry.setPlaceholderText("Page ranges, e.g. 1-3, 5, 8-")
+        self.ranges_entry.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        mode_layout.addWidget(self.ranges_entry)
+
+        self.chunk_spin = QSpinBox()
+        self.chunk_spin.setRange(1, 10000)
+        self.chunk_spin.setValue(10)
+        self.chunk_spin.setSuffix(" pages")
+        self.chunk_spin.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        mode_layout.addWidget(self.chunk_spin)
+        layout.addLayout(mode_layout)
+        self.update_mode_options()
+
+        # Batches can write thousands of files; LogView keeps the panel bounded and appends in batches
+        self.output_text = LogView()
+        self.output_text.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        layout.addWidget(self.output_text)
+
+        self.progress_bar = QProgressBar()
+        layout.addWidget(self.progress_bar)
+
+        action_layout = QHBoxLayout()
+        self.btn_action = QPushButton("🚀 Start Splitting")
+        self.btn_action.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        self.btn_action.clicked.connect(self.start_splitting)
+        action_layout.addWidget(self.btn_action)
+
+        self.btn_cancel = QPushButton("✖ Cancel")
+        self.btn_cancel.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_splitting)
+        action_layout.addWidget(self.btn_cancel)
+        layout.addLayout(action_layout)
+
+        btn_back = QPushButton("⬅ Back")
+        btn_back.setFont(QFont(DEFAULT_FONT, FONT_SIZE))
+        btn_back.clicked.connect(lambda: self.switch_page("main"))
+        layout.addWidget(btn_back)
+        self.setLayout(layout)
+
+    def update_mode_options(self):
+        mode = self.mode_combo.currentData()
+        self.ranges_entry.setVisible(mode == "ranges")
+        self.chunk_spin.setVisible(mode == "chunks")
+
+    def browse_pdf(self):
+        fname, _ = QFileDialog.getOpenFileName(self, "Select PDF", "", "PDF Files (*.pdf)")
+        if fname:
+            self.input_entry.setText(fname)
+
+    def browse_input_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of PDFs")
+        if folder:
+            self.input_entry.setText(folder)
+
+    def browse_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        if folder:
+            self.output_entry.setText(folder)
+
+    def start_splitting(self):
+        input_path = self.input_entry.text().strip()
+        output_folder = self.output_entry.text().strip()
+        if not input_path or not output_folder:
+            show_warning("Please select both an input PDF or folder and an output folder.")
+            return
+        if self.split_thread is not None:
+            return
+
+        if os.path.isdir(input_path):
+            inputs = sorted(
+                os.path.join(input_path, f) for f in os.listdir(input_path) if f.lower().endswith(".pdf")
+            )
+            if not inputs:
+                show_warning("No PDF files found in the selected folder.")
+                return
+        else:
+            inputs = [input_path]
+
+        mode = self.mode_combo.currentData()
+        ranges = self.ranges_entry.text().strip()
+        if mode == "ranges" and not ranges:
+            show_warning("Please enter the page ranges to split out.")
+            return
+
+        self.output_text.clear()
+        self.progress_bar.setMaximum(0)
+        self.progress_bar.setValue(0)
+        self.btn_action.setEnabled(False)
+        self.btn_cancel.setEnabled(True)
+
+        # Splitting runs on a worker thread so large files and batches don't freeze the window
+        self.split_thread = QThread()
+        self.split_worker = SplitWorker(inputs, output_folder, mode, ranges, self.chunk_spin.value())
+        self.split_worker.moveToThread(self.split_thread)
+
+        self.split_worker.progress.connect(self.update_progress)
+        self.split_worker.saved.connect(self.output_text.append)
+        self.split_worker.failed.connect(self.output_text.append)
+        self.split_worker.finished.connect(self.split_thread.quit)
+        self.split_worker.finished.connect(self.finish_splitting)
+
+        self.split_thread.started.connect(self.split_worker.run)
+        self.split_thread.start()
+
+    def cancel_splitting(self):
+        # Called directly: the worker's thread is busy in run() and would only see a queued call afterwards
+        if self.split_thread is not None:
+            self.split_worker.cancel()
+
+    def update_progress(self, done, total):
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+
+    def finish_splitting(self):
+        worker = self.split_worker
+        self.split_thread.wait()
+        self.split_thread = None
+        self.btn_action.setEnabled(True)
+        self.btn_cancel.setEnabled(False)
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setMaximum(1)
+
+        message = f"Done: {worker.written} files written"
+        if worker.errors:
+            message += f", {worker.errors} errors"
+        if worker.was_cancelled:
+            message += " (cancelled)"
+        self.output_text.append(message)